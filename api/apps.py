@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "api"
+
+    def ready(self):
+        # Registra os signals de invalidação dos caches em memória
+        from .utils import auth_cache, catalog_cache, reference_cache  # noqa: F401
+        from . import checks  # noqa: F401
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register()
+def shared_cache_check(app_configs, **kwargs):
+    """
+    Os caches em memória (catálogo, métodos de pagamento, tokens) se
+    invalidam entre workers por uma versão guardada em CACHES["default"].
+    Com um backend local ao processo, a invalidação não chega aos
+    outros workers e eles só se atualizam após LOCAL_CACHE_TTL.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if backend in PROCESS_LOCAL_BACKENDS:
+        return [
+            Warning(
+                f"CACHES['default'] usa {backend}, que não é compartilhado "
+                "entre processos.",
+                hint=(
+                    "Com mais de um worker (gunicorn, uwsgi) use "
+                    "DatabaseCache, Redis ou Memcached; senão mudanças de "
+                    "preço só chegam aos outros workers após LOCAL_CACHE_TTL."
+                ),
+                id="api.W001",
+            )
+        ]
+    return []
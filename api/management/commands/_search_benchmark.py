@@ -0,0 +1,125 @@
+import math
+import random
+import timeit
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+
+def percentile(samples, pct: float) -> float:
+    """Percentil pelo método nearest-rank (p50, p95...)."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+class SearchBenchmarkCommand(BaseCommand):
+    """
+    Base dos comandos que medem uma busca numa massa de dados semeada.
+
+    Os dados são criados numa transação desfeita no fim (nada fica no
+    banco). Cada busca é executada --repeat vezes e o relatório traz a
+    latência p50/p95 de todas as amostras, com os índices e de novo com
+    index scan e bitmap scan desligados (SET LOCAL), o que mostra o
+    ganho dos índices de trigramas/B-tree na mesma massa.
+
+    As subclasses definem models, default_queries, seed() e search();
+    seed() deve gravar em lotes de BATCH_SIZE (ver batches()) para não
+    montar a massa inteira em memória.
+    """
+
+    BATCH_SIZE = 5000
+
+    models = ()
+    default_queries = ()
+    default_rows = 50_000
+    default_max_p95 = None
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=self.default_rows, help="Linhas semeadas.")
+        parser.add_argument("--repeat", type=int, default=40, help="Execuções de cada busca.")
+        parser.add_argument("--limit", type=int, default=20, help="Resultados lidos por busca.")
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Termo buscado (pode repetir). Padrão: uma lista de exemplos.",
+        )
+        parser.add_argument(
+            "--skip-seq-scan",
+            action="store_true",
+            help="Não mede a busca sem índices (lenta em massas grandes).",
+        )
+        parser.add_argument(
+            "--max-p95",
+            type=float,
+            default=self.default_max_p95,
+            help="Falha se o p95 geral com índices passar deste valor (ms).",
+        )
+
+    def seed(self, rows: int, rng: random.Random):
+        raise NotImplementedError
+
+    def search(self, query: str):
+        raise NotImplementedError
+
+    def batches(self, rows: int):
+        """Faixas [início, fim) de até BATCH_SIZE linhas."""
+        for start in range(0, rows, self.BATCH_SIZE):
+            yield range(start, min(start + self.BATCH_SIZE, rows))
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options["rows"], random.Random(42))
+            with connection.cursor() as cursor:
+                for model in self.models:
+                    cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+            indexed_all, seq_scan_all = [], []
+            for query in options["queries"] or self.default_queries:
+                found, indexed = self._measure(query, options)
+                indexed_all += indexed
+                line = f"{query!r}: {found} resultados, índices {self._latency(indexed)}"
+                if not options["skip_seq_scan"]:
+                    self._set_index_scans(False)
+                    _, seq_scan = self._measure(query, options)
+                    self._set_index_scans(True)
+                    seq_scan_all += seq_scan
+                    line += f", sem índices {self._latency(seq_scan)}"
+                self.stdout.write(line)
+
+            transaction.set_rollback(True)
+
+        summary = f"geral ({options['rows']} linhas): índices {self._latency(indexed_all)}"
+        if seq_scan_all:
+            summary += f", sem índices {self._latency(seq_scan_all)}"
+        self.stdout.write(summary)
+
+        p95 = percentile(indexed_all, 95) * 1000
+        if options["max_p95"] is not None and p95 > options["max_p95"]:
+            raise CommandError(
+                f"p95 com índices de {p95:.2f} ms (limite {options['max_p95']} ms)."
+            )
+
+    def _measure(self, query: str, options) -> tuple[int, list[float]]:
+        """Quantos resultados a busca traz e a duração (s) de cada execução."""
+        limit = options["limit"]
+        found = len(list(self.search(query)[:limit]))  # aquece
+        samples = timeit.repeat(
+            lambda: list(self.search(query)[:limit]),
+            number=1,
+            repeat=options["repeat"],
+        )
+        return found, samples
+
+    @staticmethod
+    def _latency(samples) -> str:
+        return (
+            f"p50 {percentile(samples, 50) * 1000:.2f} ms / "
+            f"p95 {percentile(samples, 95) * 1000:.2f} ms"
+        )
+
+    @staticmethod
+    def _set_index_scans(enabled: bool):
+        value = "on" if enabled else "off"
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL enable_indexscan = {value}")
+            cursor.execute(f"SET LOCAL enable_bitmapscan = {value}")
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min, Value
+from django.db.models.functions import NullIf
+from ...models.customer import Customer, digits_only
+
+
+class Command(BaseCommand):
+    help = (
+        "Preenche document_digits e phone_digits dos clientes existentes, "
+        "em lotes por faixa de id (uma instrução UPDATE por lote)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Quantidade de ids por lote.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recalcula também as linhas já preenchidas.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        bounds = Customer.objects.aggregate(first=Min("id"), last=Max("id"))
+        if bounds["first"] is None:
+            self.stdout.write("Nenhum cliente cadastrado.")
+            return
+
+        updated = 0
+        start = bounds["first"]
+        while start <= bounds["last"]:
+            end = start + batch_size
+            batch = Customer.objects.filter(id__gte=start, id__lt=end)
+            if not options["all"]:
+                batch = batch.filter(
+                    document_digits__isnull=True,
+                    phone_digits__isnull=True,
+                )
+
+            # Cada lote é uma transação curta (autocommit)
+            # NullIf: campos sem dígitos ficam NULL, como no save()
+            updated += batch.update(
+                document_digits=NullIf(digits_only("cnpj_or_cpf"), Value("")),
+                phone_digits=NullIf(digits_only("phone"), Value("")),
+            )
+            start = end
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated} cliente(s) atualizado(s).")
+        )
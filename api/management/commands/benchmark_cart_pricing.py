@@ -0,0 +1,80 @@
+import random
+import timeit
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from ...models import PaymentMethod, Sale, SaleItem
+
+
+# Caminho antigo (float), mantido aqui só como base de comparação: as
+# mesmas chamadas por linha que SaleItem.refresh_subtotal e
+# Sale.calculate_totals faziam antes da camada de dinheiro.
+def _float_refresh_subtotal(item):
+    item.subtotal = round(float(item.unit_price) * item.quantity, 2)
+
+
+def _float_totals(items, discount, fee, rate, free, installments):
+    for item in items:
+        _float_refresh_subtotal(item)
+    total = max(sum(float(item.subtotal) for item in items) - float(discount), 0)
+    round(float(total) * (1 - float(fee) / 100), 2)
+    round(total * ((1 + float(rate) / 100) ** (installments - free)), 2)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o cálculo de um carrinho (subtotais, totais, lucro e juros) "
+        "em Decimal exato contra o antigo caminho em float. Não usa o banco."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=500, help="Linhas do carrinho.")
+        parser.add_argument("--repeat", type=int, default=200, help="Carrinhos por medição.")
+        parser.add_argument(
+            "--max-ratio",
+            type=float,
+            help="Falha se Decimal/float passar desta razão (ex.: 1.0).",
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        method = PaymentMethod(
+            type="credit",
+            internal_fee=Decimal("2.99"),
+            customer_interest_rate=Decimal("2.49"),
+            no_interest_installments=3,
+            max_installments=12,
+        )
+        sale = Sale(payment_method=method, discount=Decimal("3.33"))
+        items = [
+            SaleItem(
+                unit_price=Decimal(rng.randint(1, 99999)) / 100,
+                quantity=rng.randint(1, 9),
+            )
+            for _ in range(options["lines"])
+        ]
+
+        def decimal_path():
+            for item in items:
+                item.refresh_subtotal()
+            sale.calculate_totals(items)
+            method.calculate_total_with_interest(sale.total_amount, 10)
+
+        def float_path():
+            _float_totals(items, sale.discount, method.internal_fee, "2.49", 3, 10)
+
+        # Medições alternadas (melhor de 9): ruído da máquina afeta os dois lados
+        repeat = options["repeat"]
+        new = old = float("inf")
+        for _ in range(9):
+            new = min(new, timeit.timeit(decimal_path, number=repeat) / repeat)
+            old = min(old, timeit.timeit(float_path, number=repeat) / repeat)
+        ratio = new / old
+
+        self.stdout.write(
+            f"{options['lines']} linhas: Decimal {new * 1000:.3f} ms, "
+            f"float {old * 1000:.3f} ms (razão {ratio:.2f})"
+        )
+        if options["max_ratio"] is not None and ratio > options["max_ratio"]:
+            raise CommandError(
+                f"Decimal ficou {ratio:.2f}x o float (limite {options['max_ratio']})."
+            )
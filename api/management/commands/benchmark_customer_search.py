@@ -0,0 +1,63 @@
+from ...models.customer import Customer, normalize_digits
+from ._search_benchmark import SearchBenchmarkCommand
+
+FIRST_NAMES = (
+    "Maria", "José", "Ana", "João", "Francisca", "Antônio", "Adriana", "Carlos",
+    "Juliana", "Paulo", "Márcia", "Lucas", "Fernanda", "Pedro", "Patrícia", "Rafael",
+)
+LAST_NAMES = (
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira",
+    "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes",
+)
+BUSINESSES = ("Mercearia", "Padaria", "Lanchonete", "Bazar", "Distribuidora", "Restaurante")
+
+
+class Command(SearchBenchmarkCommand):
+    help = (
+        "Mede a latência p50/p95 de Customer.search_customers numa massa "
+        "semeada de clientes (1 milhão por padrão), com e sem os índices, "
+        "e falha se o p95 com índices passar de 50 ms. Nada fica gravado."
+    )
+
+    models = (Customer,)
+    default_rows = 1_000_000
+    default_max_p95 = 50.0
+    default_queries = (
+        "silva",             # sobrenome comum
+        "mariaa",            # erro de digitação (só trigramas acham)
+        "padaria",           # nome fantasia
+        "123.456",           # início de CPF, com pontuação
+        "(11) 9",            # início de telefone
+        "12345678000190",    # CNPJ completo (sem resultado)
+    )
+
+    def seed(self, rows, rng):
+        for batch in self.batches(rows):
+            Customer.objects.bulk_create([self._customer(rng) for _ in batch])
+
+    @staticmethod
+    def _customer(rng) -> Customer:
+        company = rng.random() < 0.3
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if company:
+            document = f"{rng.randint(0, 99_999_999):08d}0001{rng.randint(0, 99):02d}"
+            document = (
+                f"{document[:2]}.{document[2:5]}.{document[5:8]}/"
+                f"{document[8:12]}-{document[12:]}"
+            )
+        else:
+            document = f"{rng.randint(0, 999_999_999):09d}{rng.randint(0, 99):02d}"
+            document = f"{document[:3]}.{document[3:6]}.{document[6:9]}-{document[9:]}"
+        phone = f"({rng.randint(11, 99)}) 9{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}"
+        return Customer(
+            name=name,
+            trade_name=f"{rng.choice(BUSINESSES)} {name.split()[-1]}" if company else None,
+            cnpj_or_cpf=document,
+            phone=phone,
+            # bulk_create não passa pelo save(): preenche as cópias aqui
+            document_digits=normalize_digits(document),
+            phone_digits=normalize_digits(phone),
+        )
+
+    def search(self, query):
+        return Customer.search_customers(query)
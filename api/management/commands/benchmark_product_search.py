@@ -0,0 +1,66 @@
+from decimal import Decimal
+from ...models.category import Category
+from ...models.product import Product
+from ...models.tag import Tag
+from ._search_benchmark import SearchBenchmarkCommand
+
+WORDS = (
+    "Arroz", "Feijão", "Café", "Açúcar", "Leite", "Farinha", "Sabão", "Detergente",
+    "Biscoito", "Macarrão", "Óleo", "Sal", "Molho", "Suco", "Refrigerante", "Chocolate",
+    "Papel", "Shampoo", "Creme", "Iogurte", "Queijo", "Manteiga", "Vinagre", "Tempero",
+)
+BRANDS = ("Bom Preço", "Da Casa", "Primavera", "Real", "Estrela", "Vale Verde", "Sol", "Aurora")
+SIZES = ("200g", "500g", "1kg", "5kg", "350ml", "1L", "2L", "12un")
+
+
+class Command(SearchBenchmarkCommand):
+    help = (
+        "Mede a latência p50/p95 de Product.search_products numa massa "
+        "semeada de produtos (200 mil por padrão), categorias e tags, com "
+        "e sem os índices. Nada fica gravado."
+    )
+
+    models = (Category, Tag, Product, Product.tags.through)
+    default_rows = 200_000
+    default_queries = (
+        "arroz",         # palavra comum
+        "arrozz",        # erro de digitação (só trigramas acham)
+        "vale verde",    # marca no meio do nome
+        "00012",         # trecho de código de barras
+        "Categoria 7",   # nome de categoria
+        "Promoção",      # nome de tag
+    )
+
+    def seed(self, rows, rng):
+        categories = Category.objects.bulk_create([
+            Category(
+                name=f"Bench Categoria {n}",
+                price_tier_1=Decimal(rng.randint(100, 9999)) / 100,
+            )
+            for n in range(50)
+        ])
+        tags = Tag.objects.bulk_create([
+            Tag(name=name, color="#000000")
+            for name in ("Promoção", "Lançamento", "Orgânico", "Importado", "Sem glúten")
+        ] + [
+            Tag(name=f"Bench Tag {n}", color="#000000") for n in range(195)
+        ])
+        for batch in self.batches(rows):
+            products = Product.objects.bulk_create([
+                Product(
+                    name=f"{rng.choice(WORDS)} {rng.choice(BRANDS)} {rng.choice(SIZES)}",
+                    description=rng.choice(("", f"{rng.choice(WORDS)} selecionado")),
+                    barcode=f"789{n:010d}",
+                    stock=rng.randint(0, 500),
+                    category=rng.choice(categories),
+                )
+                for n in batch
+            ])
+            Product.tags.through.objects.bulk_create([
+                Product.tags.through(product_id=product.id, tag_id=tag.id)
+                for product in products
+                for tag in rng.sample(tags, rng.randint(0, 2))
+            ])
+
+    def search(self, query):
+        return Product.search_products(query)
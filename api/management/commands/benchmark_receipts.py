@@ -0,0 +1,75 @@
+import time
+from django.core.management.base import BaseCommand
+from ...utils import receipt_generator
+from ...utils.receipt_generator import render_sale_receipt
+
+
+def _sample_sale(items: int) -> dict:
+    return {
+        "id": 1,
+        "date": "2026-01-01T12:00:00",
+        "customer": {
+            "id": 2,
+            "name": "Mercearia Exemplo LTDA",
+            "trade_name": "Mercearia Exemplo",
+            "cnpj_or_cpf": "12.345.678/0001-90",
+            "phone": "(11) 99999-8888",
+            "address": "Rua das Flores, 123",
+        },
+        "total_amount": 12.5 * items,
+        "discount": 0.0,
+        "status": "completed",
+        "payment_method": {"id": 1, "name": "Dinheiro"},
+        "items": [
+            {
+                "id": n,
+                "product": f"Produto {n}",
+                "quantity": 1 + n % 3,
+                "unit_price": 12.5,
+                "subtotal": 12.5 * (1 + n % 3),
+            }
+            for n in range(items)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede quantos comprovantes PDF por segundo render_sale_receipt "
+        "gera para uma venda de N itens, com os dados da loja e o logo em "
+        "cache e relendo-os a cada comprovante (como antes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=30, help="Itens da venda.")
+        parser.add_argument("--seconds", type=float, default=3.0, help="Duração de cada medição.")
+
+    def handle(self, *args, **options):
+        sale = _sample_sale(options["items"])
+        change = {"money_received": 500.0, "change": 12.5}
+
+        def reload_files():
+            # Simula o caminho antigo: JSON e PNG lidos de novo a cada venda
+            receipt_generator._store_file.clear()
+            receipt_generator._logo_file.clear()
+
+        render_sale_receipt(sale, change)  # aquece
+        for label, before in (("em cache", None), ("relendo arquivos", reload_files)):
+            rate, size = self._rate(sale, change, before, options["seconds"])
+            self.stdout.write(
+                f"{options['items']} itens, {label}: {rate:.1f} comprovantes/s "
+                f"({size / 1024:.1f} KiB cada)"
+            )
+
+    @staticmethod
+    def _rate(sale, change, before, seconds):
+        count = 0
+        size = 0
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            if before is not None:
+                before()
+            size = len(render_sale_receipt(sale, change))
+            count += 1
+        return count / (time.perf_counter() - start), size
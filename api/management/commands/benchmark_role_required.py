@@ -0,0 +1,81 @@
+import timeit
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from ...models.user import User
+from ...utils.auth_cache import token_user_cache
+from ...utils.role_required import role_required
+
+
+class _View:
+    def bare(self, request):
+        return HttpResponse()
+
+    @role_required(["admin"])
+    def protected(self, request):
+        return HttpResponse()
+
+
+# Caminho antigo, mantido aqui só como base de comparação: role_required
+# validava o JWT e buscava o usuário no banco a cada chamada.
+def _jwt_each_call(request):
+    user, _ = JWTAuthentication().authenticate(request)
+    return user.role in ("admin",)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o custo de role_required por requisição (JWT com cache de "
+        "tokens) contra a validação completa do JWT a cada chamada. Cria "
+        "um usuário temporário; nada é gravado no banco."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=2000, help="Chamadas por medição.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = User.objects.create_user("bench_role_required", "bench@example.com", None)
+            user.role = "admin"
+            user.save()
+            timings = self._measure(user, options["repeat"])
+            transaction.set_rollback(True)
+
+        bare, cached, uncached = timings
+        self.stdout.write(
+            f"por chamada: view {bare * 1e6:.1f} µs, "
+            f"role_required {(cached - bare) * 1e6:.1f} µs, "
+            f"JWT completo {uncached * 1e6:.1f} µs"
+        )
+
+    @staticmethod
+    def _measure(user, repeat):
+        token = AccessToken.for_user(user)
+        factory = RequestFactory()
+        view = _View()
+
+        def request():
+            req = factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+            req.user = None
+            return req
+
+        requests = [request() for _ in range(repeat)]
+        token_user_cache.authenticate(requests[0])  # aquece o cache
+
+        def run(func):
+            return lambda: [func(req) for req in requests]
+
+        # Medições alternadas (melhor de 5): ruído da máquina afeta todos
+        best = [float("inf")] * 3
+        paths = (
+            run(lambda req: view.bare(req)),
+            run(lambda req: view.protected(req)),
+            run(_jwt_each_call),
+        )
+        for _ in range(5):
+            for i, path in enumerate(paths):
+                best[i] = min(best[i], timeit.timeit(path, number=1) / repeat)
+        return best
@@ -0,0 +1,42 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from ...utils.sales_forecast import SalesVelocityEngine
+
+
+class Command(BaseCommand):
+    help = (
+        "Atualiza a velocidade de venda dos produtos (rodar diariamente). "
+        "Por padrão lê só as vendas desde a última execução."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recalcula do zero com o último ano de vendas.",
+        )
+        parser.add_argument(
+            "--through",
+            help="Considerar vendas até esta data (AAAA-MM-DD; padrão: ontem).",
+        )
+
+    def handle(self, *args, **options):
+        through = None
+        if options["through"]:
+            try:
+                through = parse_date(options["through"])
+            except ValueError:  # formato certo, data impossível (2024-02-30)
+                through = None
+            if through is None:
+                raise CommandError("Data inválida.")
+
+        started = time.perf_counter()
+        products = SalesVelocityEngine().run(through=through, full=options["full"])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{products} produto(s) atualizado(s) em {elapsed:.1f}s."
+            )
+        )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from ...utils.sales_export import FORMATS, iter_sale_lines
+
+
+class Command(BaseCommand):
+    help = "Exporta os itens vendidos no período em CSV ou NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", required=True, help="Data inicial (AAAA-MM-DD).")
+        parser.add_argument("--end", required=True, help="Data final, inclusive (AAAA-MM-DD).")
+        parser.add_argument("--format", choices=sorted(FORMATS), default="csv")
+        parser.add_argument("--output", help="Arquivo de saída (padrão: stdout).")
+
+    def handle(self, *args, **options):
+        try:
+            start = parse_date(options["start"])
+            end = parse_date(options["end"])
+        except ValueError:  # formato certo, data impossível (2024-02-30)
+            start = end = None
+        if start is None or end is None or start > end:
+            raise CommandError("Período inválido.")
+
+        render, _ = FORMATS[options["format"]]
+        chunks = render(iter_sale_lines(start, end))
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from ...utils.print_queue import PrintWorker
+
+
+class Command(BaseCommand):
+    help = "Processa a fila de impressão de comprovantes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Segundos de espera quando a fila está vazia.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Processa os jobs pendentes e sai.",
+        )
+
+    def handle(self, *args, **options):
+        worker = PrintWorker()
+
+        if options["once"]:
+            processed = 0
+            while worker.run_once():
+                processed += 1
+            self.stdout.write(
+                self.style.SUCCESS(f"{processed} job(s) processado(s).")
+            )
+            return
+
+        self.stdout.write("🖨 Worker de impressão iniciado.")
+        worker.run_forever(options["interval"])
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from ...utils.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    help = "Remove as chaves de idempotência expiradas."
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_keys()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted} chave(s) expirada(s) removida(s).")
+        )
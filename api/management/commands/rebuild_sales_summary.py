@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from ...models.daily_sales_summary import DailySalesSummary
+
+
+class Command(BaseCommand):
+    help = "Reconstrói o resumo diário de vendas de um período."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", required=True, help="Data inicial (AAAA-MM-DD).")
+        parser.add_argument("--end", required=True, help="Data final, inclusive (AAAA-MM-DD).")
+
+    def handle(self, *args, **options):
+        try:
+            start = parse_date(options["start"])
+            end = parse_date(options["end"])
+        except ValueError:  # formato certo, data impossível (2024-02-30)
+            start = end = None
+        if start is None or end is None or start > end:
+            raise CommandError("Período inválido.")
+
+        rows = DailySalesSummary.rebuild(start, end)
+        self.stdout.write(
+            self.style.SUCCESS(f"{rows} grupo(s) gravado(s) de {start} a {end}.")
+        )
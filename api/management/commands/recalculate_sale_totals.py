@@ -0,0 +1,63 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+from ...models.daily_sales_summary import DailySalesSummary, day_bounds
+from ...models.sale import Sale
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula total, quantidade e lucro das vendas de um período "
+        "direto no banco (correção de dados) e reconstrói o resumo diário."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", required=True, help="Data inicial (AAAA-MM-DD).")
+        parser.add_argument("--end", required=True, help="Data final, inclusive (AAAA-MM-DD).")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20000,
+            help="Vendas por UPDATE (cada lote é uma transação curta).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start = parse_date(options["start"])
+            end = parse_date(options["end"])
+        except ValueError:  # formato certo, data impossível (2024-02-30)
+            start = end = None
+        if start is None or end is None or start > end:
+            raise CommandError("Período inválido.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size deve ser maior que zero.")
+
+        range_start, _ = day_bounds(start)
+        _, range_end = day_bounds(end)
+        sales = Sale.objects.filter(date__gte=range_start, date__lt=range_end)
+
+        started = time.perf_counter()
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                sales.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:options["batch_size"]]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                updated += Sale.recalculate_totals(Sale.objects.filter(id__in=ids))
+            last_id = ids[-1]
+
+        groups = DailySalesSummary.rebuild(start, end)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{updated} venda(s) recalculada(s) e {groups} grupo(s) do resumo "
+                f"reconstruído(s) em {elapsed:.1f}s."
+            )
+        )
@@ -0,0 +1,21 @@
+import time
+from django.core.management.base import BaseCommand
+from ...models.stock_snapshot import StockSnapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Registra uma foto do estoque de todos os produtos (rodar "
+        "diariamente). Consultas de estoque passado partem da foto mais próxima."
+    )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        taken_at, products = StockSnapshot.take()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Foto de {products} produto(s) em {taken_at:%d/%m/%Y %H:%M} ({elapsed:.1f}s)."
+            )
+        )
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:22
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Índices criados com CONCURRENTLY (sem travar a tabela para escrita)
+    atomic = False
+
+    dependencies = [
+        ("api", "0002_pg_trgm_extension"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="category",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="category_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="product_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("description"),
+                    name="gin_trgm_ops",
+                ),
+                name="product_description_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("barcode"),
+                    name="gin_trgm_ops",
+                ),
+                name="product_barcode_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="tag",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="tag_name_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0003_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="product",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("barcode__isnull", False), models.Q(("barcode", ""), _negated=True)
+                ),
+                fields=("barcode",),
+                name="product_barcode_unique",
+                violation_error_message="Barcode já está em uso por outro produto.",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Índices criados com CONCURRENTLY (sem travar a tabela para escrita)
+    atomic = False
+
+    dependencies = [
+        ("api", "0006_print_job"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="customer",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="customer_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="customer",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("trade_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="customer_trade_name_trgm_idx",
+            ),
+        ),
+    ]
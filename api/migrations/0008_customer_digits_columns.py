@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0007_customer_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="document_digits",
+            field=models.CharField(
+                blank=True, editable=False, max_length=20, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="customer",
+            name="phone_digits",
+            field=models.CharField(
+                blank=True, editable=False, max_length=20, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0008_customer_digits_columns"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sale",
+            index=models.Index(fields=["date"], name="sale_date_idx"),
+        ),
+    ]
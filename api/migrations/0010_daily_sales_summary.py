@@ -0,0 +1,95 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_sale_date_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySalesSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="Dia")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("completed", "Concluída"),
+                            ("cancelled", "Cancelada"),
+                            ("scheduled", "Agendada"),
+                        ],
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("sales_count", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "discount",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "profit",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("units", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "payment_method",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="api.paymentmethod",
+                        verbose_name="Método de Pagamento",
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Vendedor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumo Diário de Vendas",
+                "verbose_name_plural": "Resumos Diários de Vendas",
+                "ordering": ["-day"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("seller__isnull", False)),
+                        fields=("day", "seller", "payment_method", "status"),
+                        name="daily_sales_summary_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("seller__isnull", True)),
+                        fields=("day", "payment_method", "status"),
+                        name="daily_sales_summary_unique_no_seller",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_daily_sales_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductVelocity",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="velocity",
+                        serialize=False,
+                        to="api.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+                (
+                    "daily_velocity",
+                    models.FloatField(
+                        default=0, verbose_name="Unidades vendidas por dia"
+                    ),
+                ),
+                (
+                    "computed_through",
+                    models.DateField(verbose_name="Vendas consideradas até"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Velocidade de Venda",
+                "verbose_name_plural": "Velocidades de Venda",
+            },
+        ),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_product_velocity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockMovement",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("sale", "Venda"),
+                            ("cancellation", "Cancelamento"),
+                            ("adjustment", "Ajuste manual"),
+                            ("receiving", "Recebimento"),
+                        ],
+                        max_length=20,
+                        verbose_name="Tipo",
+                    ),
+                ),
+                ("quantity", models.IntegerField(verbose_name="Variação")),
+                ("note", models.CharField(blank=True, max_length=255, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_movements",
+                        to="api.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+                (
+                    "sale",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="stock_movements",
+                        to="api.sale",
+                        verbose_name="Venda",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="stock_movements",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Movimentação de Estoque",
+                "verbose_name_plural": "Movimentações de Estoque",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["product", "created_at"],
+                        name="stock_movement_product_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="StockSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("taken_at", models.DateTimeField(verbose_name="Registrado em")),
+                ("stock", models.IntegerField(verbose_name="Estoque")),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_snapshots",
+                        to="api.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Foto de Estoque",
+                "verbose_name_plural": "Fotos de Estoque",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "taken_at"), name="stock_snapshot_unique"
+                    )
+                ],
+            },
+        ),
+    ]
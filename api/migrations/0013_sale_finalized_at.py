@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+def mark_existing_sales_finalized(apps, schema_editor):
+    # Vendas anteriores já tiveram o estoque baixado pelo fluxo antigo
+    Sale = apps.get_model("api", "Sale")
+    Sale.objects.filter(status__in=["completed", "cancelled"]).update(
+        finalized_at=models.F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_stock_ledger"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sale",
+            name="finalized_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Finalizada em"
+            ),
+        ),
+        migrations.RunPython(mark_existing_sales_finalized, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:02
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Índice criado com CONCURRENTLY (sem travar a tabela para escrita)
+    atomic = False
+
+    dependencies = [
+        ("api", "0013_sale_finalized_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="sale",
+            index=models.Index(
+                fields=["payment_method", "status", "seller", "date"],
+                name="sale_summary_bucket_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:12
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Índices criados com CONCURRENTLY (sem travar a tabela para escrita)
+    atomic = False
+
+    dependencies = [
+        ("api", "0014_sale_summary_bucket_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="customer",
+            index=models.Index(
+                fields=["document_digits"],
+                name="customer_document_digits_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="customer",
+            index=models.Index(
+                fields=["phone_digits"],
+                name="customer_phone_digits_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -6,3 +6,9 @@ from .product import Product  # type: ignore
 from .payment_method import PaymentMethod  # type: ignore
 from .sale import Sale  # type: ignore
 from .sale_item import SaleItem  # type: ignore
+from .idempotency_key import IdempotencyKey  # type: ignore
+from .print_job import PrintJob  # type: ignore
+from .daily_sales_summary import DailySalesSummary  # type: ignore
+from .product_velocity import ProductVelocity  # type: ignore
+from .stock_movement import StockMovement  # type: ignore
+from .stock_snapshot import StockSnapshot  # type: ignore
@@ -1,4 +1,8 @@
+from decimal import Decimal
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+from ..utils.money import money
 
 
 class Category(models.Model):
@@ -46,7 +50,7 @@ class Category(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def get_price_for_quantity(self, total_quantity: int) -> float:
+    def get_price_for_quantity(self, total_quantity: int) -> Decimal:
         """
         Retorna o preço aplicável com base na quantidade total do carrinho.
         - Até quantity_limit_1 → price_tier_1
@@ -59,15 +63,15 @@ class Category(models.Model):
             and self.quantity_limit_2
             and total_quantity > self.quantity_limit_2
         ):
-            return float(self.price_tier_3)
+            return money(self.price_tier_3)
         elif (
             self.price_tier_2 is not None
             and self.quantity_limit_1
             and total_quantity > self.quantity_limit_1
         ):
-            return float(self.price_tier_2)
+            return money(self.price_tier_2)
         else:
-            return float(self.price_tier_1)
+            return money(self.price_tier_1)
 
     def __str__(self):
         return self.name
@@ -75,3 +79,9 @@ class Category(models.Model):
     class Meta:
         verbose_name = "Category"
         verbose_name_plural = "Categories"
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="category_name_trgm_idx",
+            ),
+        ]
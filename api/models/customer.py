@@ -1,10 +1,31 @@
+import re
 from django.db import models
 from django.db.models.signals import post_migrate
 from django.dispatch import receiver
 from typing import Any
 from django.apps import AppConfig
-from django.db.models import Q
-from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import F, Func, Q, Value
+from django.db.models.functions import Greatest, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramWordSimilarity
+
+# Caracteres ignorados ao reconhecer uma busca por documento/telefone
+DIGIT_SEPARATORS = " .-/()+"
+
+
+def normalize_digits(value: str | None) -> str | None:
+    """Mantém só os dígitos ("(11) 99999-8888" → "11999998888")."""
+    digits = re.sub(r"\D", "", value or "")
+    return digits or None
+
+
+def digits_only(field: str) -> Func:
+    """Expressão SQL equivalente a normalize_digits (usada no backfill)."""
+    return Func(
+        F(field), Value(r"\D"), Value(""), Value("g"),
+        function="REGEXP_REPLACE",
+        output_field=models.CharField(),
+    )
 
 
 class Customer(models.Model):
@@ -32,42 +53,89 @@ class Customer(models.Model):
         blank=True,
         null=True
     )
+
+    # 🔎 Cópias só com dígitos, mantidas pelo save() (busca no caixa)
+    document_digits = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    phone_digits = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        editable=False,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return self.trade_name or self.name
 
+    def save(self, *args, **kwargs):
+        """Mantém document_digits e phone_digits coerentes com os originais."""
+        self.document_digits = normalize_digits(self.cnpj_or_cpf)
+        self.phone_digits = normalize_digits(self.phone)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if "cnpj_or_cpf" in update_fields:
+                update_fields.add("document_digits")
+            if "phone" in update_fields:
+                update_fields.add("phone_digits")
+            kwargs["update_fields"] = update_fields
+
+        super().save(*args, **kwargs)
+
     @staticmethod
     def search_customers(query: str):
-        """Busca clientes pelo nome, nome fantasia, CNPJ/CPF, telefone ou id."""
+        """
+        Busca clientes pelo nome, nome fantasia, CNPJ/CPF, telefone ou id.
+
+        - Só dígitos (pontuação ignorada): id exato ou prefixo de
+          document_digits / phone_digits (índices B-tree).
+        - Texto: similaridade de palavra (operador %>) e icontains em
+          nome e nome fantasia (índices GIN de trigramas).
+        """
+        query = (query or "").strip()
         if not query:
             return Customer.objects.all()
 
-        # busca se for id exato
-        if query.isdigit():
-            customer_by_id = Customer.objects.filter(id=int(query))
-            if customer_by_id.exists():
-                return customer_by_id
+        digits = query.translate(str.maketrans("", "", DIGIT_SEPARATORS))
+        if digits.isdigit():
+            return (
+                Customer.objects
+                .filter(
+                    Q(document_digits__startswith=digits) |
+                    Q(phone_digits__startswith=digits) |
+                    (Q(id=int(digits)) if len(digits) <= 18 else Q())
+                )
+                .order_by("name")
+            )
 
         # Busca com trigramas
         customers = (
-            Customer.objects.annotate(
-                similarity=(
-                    TrigramSimilarity('name', query) +
-                    TrigramSimilarity('trade_name', query) +
-                    TrigramSimilarity('cnpj_or_cpf', query) +
-                    TrigramSimilarity('phone', query)
+            Customer.objects
+            .alias(
+                search_name=Upper("name"),
+                search_trade_name=Upper("trade_name"),
+            )
+            .annotate(
+                similarity=Greatest(
+                    TrigramWordSimilarity(query, "name"),
+                    TrigramWordSimilarity(query, "trade_name"),
                 )
             )
             .filter(
-                Q(similarity_name__gt=0.3) |
-                Q(similarity_trade_name__gt=0.3) |
-                Q(similarity_cnpj_or_cpf__gt=0.3) |
-                Q(similarity_phone__gt=0.3) |
-                Q(id__iexact=query)
+                Q(search_name__trigram_word_similar=query) |
+                Q(search_trade_name__trigram_word_similar=query) |
+                Q(name__icontains=query) |
+                Q(trade_name__icontains=query)
             )
-            .order_by('-similarity')
+            .order_by("-similarity", "name")
         )
 
         return customers
@@ -75,6 +143,27 @@ class Customer(models.Model):
     class Meta:
         verbose_name = "Customer"
         verbose_name_plural = "Customers"
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="customer_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("trade_name"), name="gin_trgm_ops"),
+                name="customer_trade_name_trgm_idx",
+            ),
+            # varchar_pattern_ops atende igualdade e LIKE 'prefixo%'
+            models.Index(
+                fields=["document_digits"],
+                opclasses=["varchar_pattern_ops"],
+                name="customer_document_digits_idx",
+            ),
+            models.Index(
+                fields=["phone_digits"],
+                opclasses=["varchar_pattern_ops"],
+                name="customer_phone_digits_idx",
+            ),
+        ]
 
 
 @receiver(post_migrate)
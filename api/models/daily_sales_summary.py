@@ -0,0 +1,191 @@
+from datetime import date, datetime, time, timedelta
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .payment_method import PaymentMethod
+from .sale import Sale
+
+
+SUMMARY_AGGREGATES = {
+    "sales_count": Count("id"),
+    "revenue": Sum("total_amount"),
+    "discount": Sum("discount"),
+    "profit": Sum("profit"),
+    "units": Sum("total_quantity"),
+}
+
+
+def day_bounds(day: date):
+    """Início e fim (exclusivo) do dia no fuso local."""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+class DailySalesSummary(models.Model):
+    """
+    Totais de vendas pré-calculados por dia × vendedor × método de
+    pagamento × status. Os relatórios leem só esta tabela.
+
+    Mantida a cada venda finalizada/cancelada (refresh_for_sale) e
+    reconstruída por período com manage.py rebuild_sales_summary.
+    """
+
+    day = models.DateField(verbose_name="Dia")
+    # Sem FK no banco: excluir um usuário não mexe no histórico
+    # (o rebuild move as vendas dele para o grupo "sem vendedor").
+    seller = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.DO_NOTHING,
+        db_constraint=False, null=True, blank=True,
+        related_name="+", verbose_name="Vendedor"
+    )
+    payment_method = models.ForeignKey(
+        PaymentMethod, on_delete=models.PROTECT,
+        related_name="+", verbose_name="Método de Pagamento"
+    )
+    status = models.CharField(
+        max_length=20, choices=Sale.STATUS_CHOICES, verbose_name="Status"
+    )
+
+    sales_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    discount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    profit = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    units = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # -----------------------
+    # MANUTENÇÃO
+    # -----------------------
+
+    @staticmethod
+    def _bucket(day, seller_id, payment_method_id, status) -> dict:
+        key = {
+            "day": day,
+            "payment_method_id": payment_method_id,
+            "status": status,
+        }
+        if seller_id is None:
+            key["seller__isnull"] = True
+        else:
+            key["seller_id"] = seller_id
+        return key
+
+    @classmethod
+    def refresh_bucket(cls, day, seller_id, payment_method_id, status):
+        """
+        Recalcula um grupo a partir das vendas do dia. Idempotente:
+        pode ser chamado quantas vezes for preciso para a mesma venda.
+
+        Agrega só as vendas do grupo (índice sale_summary_bucket_idx),
+        não o dia inteiro. Não usa deltas com F(): uma venda pendente
+        pode ser finalizada várias vezes com totais diferentes, e um
+        delta exigiria saber quanto a venda já tinha somado ao grupo;
+        um erro ficaria no resumo até o próximo rebuild.
+        """
+        key = cls._bucket(day, seller_id, payment_method_id, status)
+        start, end = day_bounds(day)
+
+        for attempt in range(2):
+            try:
+                with transaction.atomic():
+                    # Trava o grupo antes de agregar para que duas vendas
+                    # simultâneas não gravem totais defasados
+                    row = cls.objects.select_for_update().filter(**key).first()
+
+                    sales = Sale.objects.filter(
+                        date__gte=start,
+                        date__lt=end,
+                        payment_method_id=payment_method_id,
+                        status=status,
+                    )
+                    if seller_id is None:
+                        sales = sales.filter(seller__isnull=True)
+                    else:
+                        sales = sales.filter(seller_id=seller_id)
+                    totals = sales.aggregate(**SUMMARY_AGGREGATES)
+
+                    if not totals["sales_count"]:
+                        if row is not None:
+                            row.delete()
+                        return
+
+                    if row is None:
+                        row = cls(
+                            day=day,
+                            seller_id=seller_id,
+                            payment_method_id=payment_method_id,
+                            status=status,
+                        )
+                    for field, value in totals.items():
+                        setattr(row, field, value or 0)
+                    row.save()
+                    return
+            except IntegrityError:
+                # Outro processo criou o grupo ao mesmo tempo: tenta de novo
+                if attempt:
+                    raise
+
+    @classmethod
+    def refresh_for_sale(cls, sale: Sale, previous_status: str | None = None):
+        """Atualiza o(s) grupo(s) afetado(s) por uma venda."""
+        day = timezone.localtime(sale.date).date()
+        statuses = {sale.status}
+        if previous_status:
+            statuses.add(previous_status)
+        for status in statuses:
+            cls.refresh_bucket(day, sale.seller_id, sale.payment_method_id, status)
+
+    @classmethod
+    def rebuild(cls, start: date, end: date) -> int:
+        """
+        Reconstrói todos os grupos de [start, end] com um único GROUP BY.
+        Retorna quantos grupos foram gravados.
+        """
+        range_start, _ = day_bounds(start)
+        _, range_end = day_bounds(end)
+
+        rows = (
+            Sale.objects
+            .filter(date__gte=range_start, date__lt=range_end)
+            .annotate(day=TruncDate("date", tzinfo=timezone.get_current_timezone()))
+            .values("day", "seller_id", "payment_method_id", "status")
+            .annotate(**SUMMARY_AGGREGATES)
+            .order_by()
+        )
+
+        with transaction.atomic():
+            cls.objects.filter(day__gte=start, day__lte=end).delete()
+            summaries = cls.objects.bulk_create(
+                [
+                    cls(**{
+                        field: (value or 0) if field in SUMMARY_AGGREGATES else value
+                        for field, value in row.items()
+                    })
+                    for row in rows
+                ],
+                batch_size=1000,
+            )
+        return len(summaries)
+
+    def __str__(self):
+        return f"{self.day} - {self.payment_method_id} ({self.status})"
+
+    class Meta:
+        verbose_name = "Resumo Diário de Vendas"
+        verbose_name_plural = "Resumos Diários de Vendas"
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "seller", "payment_method", "status"],
+                condition=Q(seller__isnull=False),
+                name="daily_sales_summary_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["day", "payment_method", "status"],
+                condition=Q(seller__isnull=True),
+                name="daily_sales_summary_unique_no_seller",
+            ),
+        ]
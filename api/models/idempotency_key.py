@@ -0,0 +1,41 @@
+from django.db import models
+from django.conf import settings
+
+
+class IdempotencyKey(models.Model):
+    """
+    Resposta armazenada de uma requisição enviada com o header
+    Idempotency-Key. Retentativas com a mesma chave recebem a resposta
+    gravada, sem executar a operação de novo.
+    """
+
+    key = models.CharField(max_length=255, verbose_name="Chave")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+    )
+    fingerprint = models.CharField(
+        max_length=64,
+        verbose_name="Impressão digital da requisição",
+        help_text="SHA-256 de método, caminho e corpo.",
+    )
+    status_code = models.PositiveSmallIntegerField()
+    content_type = models.CharField(max_length=100)
+    response_body = models.TextField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.status_code})"
+
+    class Meta:
+        verbose_name = "Chave de Idempotência"
+        verbose_name_plural = "Chaves de Idempotência"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"],
+                name="idempotency_key_unique_per_user",
+            ),
+        ]
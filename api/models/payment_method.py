@@ -1,5 +1,7 @@
+from decimal import Decimal
 from django.db import models
 from django.core.validators import MinValueValidator
+from ..utils.money import compound_factor, money, multiply
 
 
 class PaymentMethod(models.Model):
@@ -111,30 +113,48 @@ class PaymentMethod(models.Model):
             self.customer_interest_rate = 0
             self.min_installment_amount = 0
 
+    def allows_installments(self) -> bool:
+        return self.type in ["credit", "boleto"]
+
+    def installment_factors(self) -> list[Decimal]:
+        """
+        Fator de juros de cada opção de parcelamento: o item n-1 é o
+        multiplicador do valor para n parcelas (1 nas sem juros).
+        """
+        free = self.no_interest_installments or 1
+        max_installments = (
+            (self.max_installments or 1) if self.allows_installments() else 1
+        )
+        return [
+            compound_factor(self.customer_interest_rate, n - free)
+            if self.customer_interest_rate and n > free
+            else Decimal(1)
+            for n in range(1, max_installments + 1)
+        ]
+
     def calculate_total_with_interest(
         self,
-        amount: float,
+        amount,
         installments: int,
-    ) -> float:
+    ) -> Decimal:
         """
         Retorna o valor total considerando juros e número de parcelas.
         Só faz sentido para 'credit' ou 'boleto'.
         """
-        if self.type not in ["credit", "boleto"]:
-            return float(amount)
+        if not self.allows_installments():
+            return money(amount)
 
         if (
             not self.customer_interest_rate
             or installments <= (self.no_interest_installments or 1)
         ):
-            return float(amount)
+            return money(amount)
 
-        monthly_interest = float(self.customer_interest_rate) / 100
-        total = amount * (
-            (1 + monthly_interest)
-            ** (installments - (self.no_interest_installments or 1))
+        factor = compound_factor(
+            self.customer_interest_rate,
+            installments - (self.no_interest_installments or 1),
         )
-        return round(total, 2)
+        return multiply(amount, factor)
 
     def __str__(self):
         return f"{self.name} ({self.get_type_display()})"
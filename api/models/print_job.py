@@ -0,0 +1,61 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+from .sale import Sale
+
+
+class PrintJob(models.Model):
+    """
+    Comprovante aguardando impressão. O caixa só enfileira o job;
+    o worker (manage.py print_worker) imprime e faz as retentativas.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pendente"),
+        ("printing", "Imprimindo"),
+        ("done", "Impresso"),
+        ("failed", "Falhou"),
+    ]
+
+    sale = models.ForeignKey(
+        Sale, on_delete=models.CASCADE,
+        related_name="print_jobs", verbose_name="Venda"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
+        null=True, blank=True, related_name="print_jobs",
+        verbose_name="Usuário"
+    )
+
+    # 🖨 Impressora resolvida no momento do enfileiramento
+    printer_name = models.CharField(max_length=255, blank=True, null=True)
+    interface = models.CharField(max_length=20, default="system")
+    change = models.JSONField(blank=True, null=True, verbose_name="Troco")
+
+    # 📋 Situação e retentativas
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="pending",
+        verbose_name="Status"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, null=True)
+    printed_at = models.DateTimeField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Impressão #{self.id} - venda #{self.sale_id} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = "Job de Impressão"
+        verbose_name_plural = "Jobs de Impressão"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="print_job_queue_idx",
+            ),
+        ]
@@ -1,11 +1,12 @@
-from django.db import models
+from django.db import connection, models
 import os
 from django.core.files.base import ContentFile
-from django.forms import ValidationError
 from .tag import Tag
 from .category import Category
-from django.contrib.postgres.search import TrigramSimilarity
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.db.models import Q
+from django.db.models.functions import Upper
 
 
 class Product(models.Model):
@@ -39,11 +40,10 @@ class Product(models.Model):
         return self.name
 
     def clean(self):
-        # Caso barcode seja diferente de none ou vazio, checar se já existe outro produto com o mesmo barcode
-        if self.barcode:
-            existing = Product.objects.filter(barcode=self.barcode).exclude(id=self.id)
-            if existing.exists():
-                raise ValidationError("Barcode já está em uso por outro produto.")
+        # A unicidade do barcode é garantida pelo índice único parcial
+        # (ver Meta.constraints); aqui só normalizamos o valor.
+        if self.barcode is not None:
+            self.barcode = self.barcode.strip() or None
 
     def upload_image(self, image_file):
         """Salva uma nova imagem para o produto com nome padronizado."""
@@ -59,39 +59,139 @@ class Product(models.Model):
         '''Remove uma tag do produto.'''
         self.tags.remove(tag)
 
+    @staticmethod
+    def apply_stock_deltas(deltas: dict[int, int], kind: str = "adjustment",
+                           sale=None, user=None, note=None):
+        """
+        Aplica variações de estoque {product_id: delta} direto no banco,
+        sem ler-modificar-gravar em Python (não perde atualizações de
+        caixas vendendo o mesmo produto ao mesmo tempo).
+
+        - As linhas são travadas em ordem de id antes da alteração, para
+          que transações concorrentes não entrem em deadlock.
+        - Todas as linhas são alteradas num único UPDATE ... FROM (VALUES ...).
+        - O estoque nunca fica negativo.
+        - A variação efetivamente aplicada de cada produto vai para o
+          livro de movimentações (StockMovement) num único bulk_create.
+
+        Retorna {product_id: variação aplicada}.
+        Deve ser chamado dentro de transaction.atomic().
+        """
+        from .stock_movement import StockMovement  # evita import circular
+
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return {}
+
+        ids = sorted(deltas)
+        before = dict(
+            Product.objects
+            .select_for_update()
+            .filter(id__in=ids)
+            .order_by('id')
+            .values_list('id', 'stock')
+        )
+
+        table = connection.ops.quote_name(Product._meta.db_table)
+        values_sql = ', '.join(['(%s, %s)'] * len(ids))
+        params = [value for pk in ids for value in (pk, deltas[pk])]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} AS p '
+                'SET stock = GREATEST(p.stock + v.delta, 0) '
+                f'FROM (VALUES {values_sql}) AS v(id, delta) '
+                'WHERE p.id = v.id '
+                'RETURNING p.id, p.stock',
+                params,
+            )
+            after = dict(cursor.fetchall())
+
+        applied = {
+            pk: after[pk] - before[pk]
+            for pk in ids
+            if pk in after and after[pk] != before[pk]
+        }
+        StockMovement.objects.bulk_create([
+            StockMovement(
+                product_id=pk, kind=kind, quantity=quantity,
+                sale=sale, user=user, note=note,
+            )
+            for pk, quantity in applied.items()
+        ])
+        return applied
+
+    @staticmethod
+    def get_by_barcode(barcode: str):
+        """
+        Busca exata por código de barras (leitura do scanner no caixa).
+        Resolve com uma única consulta no índice único parcial de barcode.
+        Retorna o produto (com a categoria carregada) ou None.
+        """
+        barcode = (barcode or '').strip()
+        if not barcode:
+            return None
+
+        return (
+            Product.objects
+            .select_related('category')
+            .filter(barcode=barcode)
+            .first()
+        )
+
     @staticmethod
     def search_products(query: str):
         """
         Realiza uma busca inteligente por produtos:
         - Procura correspondência parcial (icontains)
-        - Usa similaridade de texto (TrigramSimilarity)
-        - Busca em: nome, descrição, categoria e tags
+        - Usa similaridade de palavra (operador %> do pg_trgm)
+        - Busca em: nome, descrição, código de barras, categoria e tags
         - Ordena por relevância
+
+        Todos os filtros sobre Product são atendidos por índices (GIN de
+        trigramas, ver Meta.indexes, e a chave primária), então o
+        Postgres combina tudo num BitmapOr. Categorias e tags são
+        resolvidas antes, em ids: um Exists correlacionado no OR
+        forçaria um seq scan de Product com subplano por linha.
         """
 
-        if not query.strip():
+        query = query.strip()
+        if not query:
             return Product.objects.none()
 
-        # Busca com trigramas (fuzzy search)
+        category_ids = list(
+            Category.objects
+            .filter(name__icontains=query)
+            .values_list('id', flat=True)
+        )
+        tag_ids = list(
+            Tag.objects
+            .filter(name__icontains=query)
+            .values_list('id', flat=True)
+        )
+        tagged_ids = list(
+            Product.tags.through.objects
+            .filter(tag_id__in=tag_ids)
+            .values_list('product_id', flat=True)
+            .distinct()
+        ) if tag_ids else []
+
+        filters = (
+            Q(search_name__trigram_word_similar=query) |  # fuzzy search
+            Q(name__icontains=query) |
+            Q(description__icontains=query) |
+            Q(barcode__icontains=query)
+        )
+        if category_ids:
+            filters |= Q(category_id__in=category_ids)
+        if tagged_ids:
+            filters |= Q(pk__in=tagged_ids)
+
         products = (
             Product.objects
-            .annotate(
-                similarity=(
-                    TrigramSimilarity('name', query) +
-                    TrigramSimilarity('description', query) +
-                    TrigramSimilarity('category__name', query)
-                )
-            )
-            .filter(
-                Q(name__icontains=query) |
-                Q(description__icontains=query) |
-                Q(barcode__icontains=query) |
-                Q(category__name__icontains=query) |
-                Q(tags__name__icontains=query) |
-                Q(similarity__gt=0.2)  # tolerância de similaridade
-            )
-            .distinct()
-            .order_by('-similarity')  # mais parecidos primeiro
+            .alias(search_name=Upper('name'))
+            .annotate(similarity=TrigramWordSimilarity(query, 'name'))
+            .filter(filters)
+            .order_by('-similarity', 'name')  # mais parecidos primeiro
         )
 
         return products
@@ -100,3 +200,27 @@ class Product(models.Model):
         ordering = ['name']
         verbose_name = 'Product'
         verbose_name_plural = 'Products'
+        # Índices de trigramas sobre UPPER(coluna): atendem tanto o
+        # icontains (UPPER(col) LIKE UPPER(...)) quanto o operador %>.
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='product_name_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='product_description_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('barcode'), name='gin_trgm_ops'),
+                name='product_barcode_trgm_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['barcode'],
+                condition=Q(barcode__isnull=False) & ~Q(barcode=''),
+                name='product_barcode_unique',
+                violation_error_message='Barcode já está em uso por outro produto.',
+            ),
+        ]
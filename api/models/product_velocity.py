@@ -0,0 +1,30 @@
+from django.db import models
+from .product import Product
+
+
+class ProductVelocity(models.Model):
+    """
+    Velocidade de venda do produto (média móvel exponencial de unidades
+    vendidas por dia), calculada em lote por manage.py
+    compute_sales_velocity. Base da lista de reposição.
+    """
+
+    product = models.OneToOneField(
+        Product, on_delete=models.CASCADE,
+        primary_key=True, related_name="velocity",
+        verbose_name="Produto"
+    )
+    daily_velocity = models.FloatField(
+        default=0, verbose_name="Unidades vendidas por dia"
+    )
+    computed_through = models.DateField(
+        verbose_name="Vendas consideradas até"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.product_id}: {self.daily_velocity:.2f}/dia"
+
+    class Meta:
+        verbose_name = "Velocidade de Venda"
+        verbose_name_plural = "Velocidades de Venda"
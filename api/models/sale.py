@@ -1,10 +1,21 @@
-from django.db import models
+from decimal import Decimal
+from django.db import connection, models, transaction
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 from django.conf import settings
 from .product import Product
 from .payment_method import PaymentMethod
 from .customer import Customer
+from ..utils.money import money, net_of_percent
+
+# Maior quantidade gravável (SaleItem.quantity e Sale.total_quantity
+# são PositiveIntegerField)
+MAX_QUANTITY = 2_147_483_647
+
+
+class SaleAlreadyFinalized(ValidationError):
+    """A venda já teve o estoque baixado (ou foi cancelada)."""
 
 
 class Sale(models.Model):
@@ -72,6 +83,11 @@ class Sale(models.Model):
 
     notes = models.TextField(blank=True, null=True, verbose_name="Observações")
 
+    # ✅ Quando o estoque foi baixado (venda concluída e finalizada)
+    finalized_at = models.DateTimeField(
+        blank=True, null=True, verbose_name="Finalizada em"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -79,65 +95,345 @@ class Sale(models.Model):
     # MÉTODOS DE NEGÓCIO
     # ==================================================
 
-    def calculate_totals(self):
-        """Recalcula total, quantidade total e lucro líquido."""
-        items = self.items.all()
-        gross_total = sum(float(item.subtotal) for item in items)
-        self.total_quantity = sum(item.quantity for item in items)
+    def calculate_totals(self, items=None):
+        """
+        Recalcula total, quantidade total e lucro líquido, em Decimal
+        exato (api/utils/money.py).
+
+        Com os itens já carregados soma em memória; sem eles, soma no
+        banco numa única consulta. A taxa do método de pagamento vem do
+        reference_cache (sem carregar self.payment_method).
+        """
+        if items is not None:
+            gross_total = sum((item.subtotal for item in items), Decimal(0))
+            self.total_quantity = sum(item.quantity for item in items)
+        else:
+            totals = self.items.aggregate(
+                gross=models.Sum("subtotal"), quantity=models.Sum("quantity"),
+            )
+            gross_total = totals["gross"] or Decimal(0)
+            self.total_quantity = totals["quantity"] or 0
 
         # Aplica desconto
-        self.total_amount = max(gross_total - float(self.discount or 0), 0)
+        self.total_amount = max(money(gross_total) - money(self.discount), Decimal(0))
 
         # Calcula lucro líquido descontando taxa de operadora
-        fee = float(self.payment_method.internal_fee or 0) / 100
-        self.profit = round(float(self.total_amount) * (1 - fee), 2)
+        self.profit = net_of_percent(self.total_amount, self.get_payment_method().internal_fee)
+
+    def get_payment_method(self) -> PaymentMethod:
+        """
+        Método de pagamento da venda sem consulta: usa o já carregado
+        ou o do reference_cache.
+        """
+        from ..utils.reference_cache import reference_cache  # evita import circular
+
+        if Sale.payment_method.is_cached(self):
+            return self.payment_method
+        method = reference_cache.get_payment_method(self.payment_method_id)
+        if method is None:
+            raise PaymentMethod.DoesNotExist("Método de pagamento não encontrado.")
+        return method
+
+    @staticmethod
+    def recalculate_totals(sales) -> int:
+        """
+        Recalcula total, quantidade e lucro de todas as vendas do
+        queryset `sales` com um único UPDATE ... FROM (soma dos itens e
+        taxa do método de pagamento no próprio banco). Mesmas regras de
+        calculate_totals: desconto não deixa o total negativo e o lucro
+        é arredondado para centavos (ROUND do Postgres, meio para cima).
+
+        Retorna quantas vendas foram atualizadas.
+        """
+        from .sale_item import SaleItem  # evita import circular
+
+        quote = connection.ops.quote_name
+        sale_table = quote(Sale._meta.db_table)
+        item_table = quote(SaleItem._meta.db_table)
+        method_table = quote(PaymentMethod._meta.db_table)
+        ids_sql, ids_params = sales.order_by().values("id").query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {sale_table} AS s "
+                "SET total_quantity = t.quantity, "
+                "total_amount = t.total, "
+                "profit = ROUND(t.total * (100 - pm.internal_fee) / 100, 2), "
+                "updated_at = %s "
+                "FROM ("
+                "SELECT s2.id, "
+                "GREATEST(COALESCE(SUM(i.subtotal), 0) - s2.discount, 0) AS total, "
+                "COALESCE(SUM(i.quantity), 0) AS quantity "
+                f"FROM {sale_table} AS s2 "
+                f"LEFT JOIN {item_table} AS i ON i.sale_id = s2.id "
+                f"WHERE s2.id IN ({ids_sql}) "
+                "GROUP BY s2.id"
+                f") AS t, {method_table} AS pm "
+                "WHERE s.id = t.id AND pm.id = s.payment_method_id",
+                [timezone.now(), *ids_params],
+            )
+            return cursor.rowcount
 
     def update_items_prices(self):
         """
         Atualiza automaticamente os preços unitários e subtotais
         de acordo com a quantidade total do carrinho.
+
+        Os itens são lidos uma vez, repreçados numa passada vetorizada
+        (pricing_engine, sobre as faixas do cache do catálogo) e gravados com um único bulk_update, então o
+        número de consultas não depende do tamanho do carrinho.
         """
-        items = self.items.all()
-        total_qty = sum(item.quantity for item in items)
+        from ..utils.catalog_cache import catalog_cache  # evita import circular
+        from ..utils.pricing_engine import pricing_engine
+        from .sale_item import SaleItem
+
+        items = list(
+            self.items.only("id", "product", "quantity", "unit_price", "subtotal")
+        )
+        products = catalog_cache.get_products([item.product_id for item in items])
+        quote = pricing_engine.price_cart([
+            (products[item.product_id].category_id, item.quantity)
+            for item in items
+        ])
+
+        for item, unit_price, subtotal in zip(items, quote.unit_prices, quote.subtotals):
+            item.unit_price = unit_price
+            item.subtotal = subtotal
 
-        for item in items:
-            item.unit_price = item.product.category.get_price_for_quantity(total_qty)
-            item.save()
+        SaleItem.objects.bulk_update(items, ["unit_price", "subtotal"])
 
         # Recalcula valores gerais
-        self.calculate_totals()
+        self.calculate_totals(items)
         self.save()
 
+    @staticmethod
+    def resolve_cart(cart: list[dict]) -> list[tuple]:
+        """
+        Resolve o carrinho (por id ou código de barras) em
+        [(produto, quantidade), ...] usando o cache do catálogo.
+        """
+        from ..utils.catalog_cache import catalog_cache  # evita import circular
+
+        if not cart:
+            raise ValidationError("O carrinho está vazio.")
+
+        entries = []
+        for entry in cart:
+            try:
+                quantity = int(entry.get("quantity", 1))
+            except (TypeError, ValueError):
+                raise ValidationError("Quantidade inválida.")
+            if quantity <= 0:
+                raise ValidationError("Quantidade deve ser maior que zero.")
+            if quantity > MAX_QUANTITY:
+                raise ValidationError("Quantidade muito grande.")
+            entries.append((entry, quantity))
+        if sum(quantity for _, quantity in entries) > MAX_QUANTITY:
+            raise ValidationError("Quantidade total do carrinho muito grande.")
+
+        # Uma consulta para os ids e outra para os códigos de barras
+        # que ainda não estão no cache, qualquer que seja o tamanho
+        by_id = catalog_cache.get_products([
+            int(entry["product_id"])
+            for entry, _ in entries
+            if entry.get("product_id") is not None
+        ])
+        by_barcode = catalog_cache.get_products_by_barcode([
+            entry.get("barcode")
+            for entry, _ in entries
+            if entry.get("product_id") is None
+        ])
+
+        lines = []
+        for entry, quantity in entries:
+            if entry.get("product_id") is not None:
+                product = by_id.get(int(entry["product_id"]))
+            else:
+                product = by_barcode.get((entry.get("barcode") or "").strip())
+            if product is None:
+                raise ValidationError(
+                    f"Produto não encontrado: "
+                    f"{entry.get('product_id') or entry.get('barcode')}"
+                )
+            lines.append((product, quantity))
+        return lines
+
+    @classmethod
+    def checkout(
+        cls,
+        cart: list[dict],
+        payment_method_id: int,
+        seller=None,
+        customer_id: int | None = None,
+        discount=0,
+        installments: int = 1,
+        notes: str | None = None,
+    ) -> "Sale":
+        """
+        Cria a venda completa numa única transação:
+        - Precifica o carrinho pelas faixas da categoria
+        - Insere todos os itens com um único bulk_create
+        - Baixa o estoque
+
+        cart: [{"product_id": 1, "quantity": 2}, {"barcode": "789...", "quantity": 1}]
+        """
+        from ..utils.pricing_engine import pricing_engine  # evita import circular
+        from ..utils.reference_cache import reference_cache
+        from .daily_sales_summary import DailySalesSummary
+        from .sale_item import SaleItem
+
+        lines = cls.resolve_cart(cart)
+
+        payment_method = reference_cache.get_active_payment_method(payment_method_id)
+        if payment_method is None:
+            raise ValidationError("Método de pagamento inválido.")
+
+        if installments < 1 or installments > (payment_method.max_installments or 1):
+            raise ValidationError("Número de parcelas inválido.")
+
+        quote = pricing_engine.price_cart([
+            (product.category_id, quantity) for product, quantity in lines
+        ])
+        items = [
+            SaleItem(
+                product=product,
+                quantity=quantity,
+                unit_price=unit_price,
+                subtotal=subtotal,
+            )
+            for (product, quantity), unit_price, subtotal
+            in zip(lines, quote.unit_prices, quote.subtotals)
+        ]
+
+        sale = cls(
+            payment_method=payment_method,
+            seller=seller,
+            discount=max(money(discount), Decimal(0)),
+            notes=notes,
+            finalized_at=timezone.now(),
+        )
+        if customer_id is not None:
+            if not Customer.objects.filter(id=customer_id).exists():
+                raise ValidationError("Cliente não encontrado.")
+            sale.customer_id = customer_id
+        sale.calculate_totals(items)
+
+        if (
+            installments > 1
+            and payment_method.min_installment_amount
+            and sale.total_amount < payment_method.min_installment_amount
+        ):
+            raise ValidationError("Valor mínimo para parcelamento não atingido.")
+
+        sale.paid_amount = payment_method.calculate_total_with_interest(
+            sale.total_amount, installments,
+        )
+
+        with transaction.atomic():
+            sale.save()
+            for item in items:
+                item.sale = sale
+            SaleItem.objects.bulk_create(items)
+
+            if sale.status == "completed":
+                deltas: dict[int, int] = {}
+                for product, quantity in lines:
+                    deltas[product.id] = deltas.get(product.id, 0) - quantity
+                Product.apply_stock_deltas(
+                    deltas, kind="sale", sale=sale, user=seller,
+                )
+
+            DailySalesSummary.refresh_for_sale(sale)
+
+        return sale
+
+    def stock_quantities(self) -> dict[int, int]:
+        """Retorna {product_id: quantidade total} dos itens da venda."""
+        rows = (
+            self.items
+            .order_by()
+            .values("product_id")
+            .annotate(total=models.Sum("quantity"))
+        )
+        return {row["product_id"]: row["total"] for row in rows}
+
     def finalize_sale(self):
         """
-        Conclui a venda:
+        Conclui a venda numa única transação:
         - Atualiza preços e totais
-        - Diminui estoque dos produtos (se for venda imediata)
+        - Diminui estoque dos produtos (se for venda imediata) e marca
+          finalized_at
+        - Atualiza o resumo diário de vendas
+
+        A venda é travada (select_for_update) e uma venda já finalizada
+        ou cancelada levanta SaleAlreadyFinalized, então chamadas
+        repetidas ou simultâneas não baixam o estoque duas vezes.
         """
-        from .sale_item import SaleItem  # evita import circular
+        from .daily_sales_summary import DailySalesSummary  # evita import circular
 
-        self.update_items_prices()
+        with transaction.atomic():
+            status, finalized_at = (
+                Sale.objects
+                .select_for_update()
+                .values_list("status", "finalized_at")
+                .get(pk=self.pk)
+            )
+            if finalized_at is not None or status == "cancelled":
+                raise SaleAlreadyFinalized("A venda já foi finalizada ou cancelada.")
 
-        if self.status == "completed":
-            for item in self.items.select_related("product"):
-                item.product.stock = max(item.product.stock - item.quantity, 0)
-                item.product.save()
+            self.status = status
+            if status == "completed":
+                self.finalized_at = timezone.now()
+            self.update_items_prices()
 
-    def cancel_sale(self):
-        """Cancela a venda e, se necessário, repõe o estoque."""
-        if self.status == "completed":
-            for item in self.items.select_related("product"):
-                item.product.stock += item.quantity
-                item.product.save()
+            if status == "completed":
+                Product.apply_stock_deltas(
+                    {
+                        product_id: -quantity
+                        for product_id, quantity in self.stock_quantities().items()
+                    },
+                    kind="sale", sale=self, user=self.seller,
+                )
 
-        self.status = "cancelled"
-        self.save()
+            DailySalesSummary.refresh_for_sale(self)
 
-    def apply_discount(self, value: float):
-        """Aplica um desconto fixo e recalcula totais."""
-        self.discount = max(float(value), 0)
-        self.calculate_totals()
-        self.save()
+    def cancel_sale(self, user=None):
+        """
+        Cancela a venda e, se o estoque já foi baixado, repõe.
+        `user` (quem cancelou) vai para o livro de movimentações.
+        """
+        from .daily_sales_summary import DailySalesSummary  # evita import circular
+
+        with transaction.atomic():
+            # Trava a venda para que dois cancelamentos simultâneos
+            # não reponham o estoque duas vezes
+            status, finalized_at = (
+                Sale.objects
+                .select_for_update()
+                .values_list("status", "finalized_at")
+                .get(pk=self.pk)
+            )
+
+            if status == "completed" and finalized_at is not None:
+                Product.apply_stock_deltas(
+                    self.stock_quantities(), kind="cancellation", sale=self, user=user,
+                )
+
+            self.status = "cancelled"
+            self.save()
+
+            DailySalesSummary.refresh_for_sale(self, previous_status=status)
+
+    def apply_discount(self, value):
+        """Aplica um desconto fixo, recalcula totais e o resumo diário."""
+        from .daily_sales_summary import DailySalesSummary  # evita import circular
+
+        with transaction.atomic():
+            self.discount = max(money(value), Decimal(0))
+            self.calculate_totals()
+            self.save()
+
+            DailySalesSummary.refresh_for_sale(self)
 
     def __str__(self):
         return f"Venda #{self.id or 'N/A'} - {self.customer.name} ({self.get_status_display()})"
@@ -146,3 +442,11 @@ class Sale(models.Model):
         verbose_name = "Venda"
         verbose_name_plural = "Vendas"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["date"], name="sale_date_idx"),
+            # Um grupo do resumo diário (DailySalesSummary.refresh_bucket)
+            models.Index(
+                fields=["payment_method", "status", "seller", "date"],
+                name="sale_summary_bucket_idx",
+            ),
+        ]
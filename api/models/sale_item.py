@@ -1,6 +1,8 @@
+from decimal import Decimal
 from django.db import models
 from .sale import Sale
 from .product import Product
+from ..utils.money import multiply
 
 
 class SaleItem(models.Model):
@@ -22,27 +24,34 @@ class SaleItem(models.Model):
         """
         Salva o item garantindo que o subtotal esteja coerente com o preço unitário.
         """
-        self.subtotal = round(float(self.unit_price) * self.quantity, 2)
+        self.refresh_subtotal()
         super().save(*args, **kwargs)
 
+    def refresh_subtotal(self):
+        """Recalcula o subtotal a partir do preço unitário e da quantidade."""
+        self.subtotal = multiply(self.unit_price, self.quantity)
+
     def __str__(self):
         return f"{self.product.name} x{self.quantity}"
 
-    def get_total_price(self, total_cart_quantity: int) -> float:
+    def get_total_price(self, total_cart_quantity: int) -> Decimal:
         """
         Retorna o total do item considerando a quantidade total do carrinho.
         Usa o método da categoria para determinar o preço correto.
         """
-        unit_price = self.product.category.get_price_for_quantity(total_cart_quantity)
-        total = round(float(unit_price) * self.quantity, 2)
-        return total
+        unit_price = self.get_unit_price_for_quantity(total_cart_quantity)
+        return multiply(unit_price, self.quantity)
 
-    def get_unit_price_for_quantity(self, total_cart_quantity: int) -> float:
+    def get_unit_price_for_quantity(self, total_cart_quantity: int) -> Decimal:
         """
         Retorna apenas o preço unitário correto para a quantidade total do carrinho.
         Útil para exibir valores no frontend sem recalcular tudo.
+        A categoria vem do cache do catálogo (sem consulta ao banco).
         """
-        return self.product.category.get_price_for_quantity(total_cart_quantity)
+        from ..utils.catalog_cache import catalog_cache  # evita import circular
+
+        category = catalog_cache.get_category_for_product(self.product_id)
+        return category.get_price_for_quantity(total_cart_quantity)
 
     class Meta:
         verbose_name = "Item da Venda"
@@ -0,0 +1,62 @@
+from django.db import models
+from django.conf import settings
+from .product import Product
+from .sale import Sale
+
+
+class StockMovement(models.Model):
+    """
+    Livro de movimentações de estoque (somente inserção).
+    Cada alteração de Product.stock feita por Product.apply_stock_deltas
+    grava aqui a variação efetivamente aplicada, na mesma transação.
+    """
+
+    KIND_CHOICES = [
+        ("sale", "Venda"),
+        ("cancellation", "Cancelamento"),
+        ("adjustment", "Ajuste manual"),
+        ("receiving", "Recebimento"),
+    ]
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE,
+        related_name="stock_movements", verbose_name="Produto"
+    )
+    kind = models.CharField(
+        max_length=20, choices=KIND_CHOICES, verbose_name="Tipo"
+    )
+    quantity = models.IntegerField(verbose_name="Variação")
+    sale = models.ForeignKey(
+        Sale, on_delete=models.SET_NULL,
+        null=True, blank=True, related_name="stock_movements",
+        verbose_name="Venda"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
+        null=True, blank=True, related_name="stock_movements",
+        verbose_name="Usuário"
+    )
+    note = models.CharField(max_length=255, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValueError("Movimentações de estoque não podem ser alteradas.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Movimentações de estoque não podem ser apagadas.")
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.quantity:+d} - produto {self.product_id}"
+
+    class Meta:
+        verbose_name = "Movimentação de Estoque"
+        verbose_name_plural = "Movimentações de Estoque"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["product", "created_at"],
+                name="stock_movement_product_idx",
+            ),
+        ]
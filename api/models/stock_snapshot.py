@@ -0,0 +1,96 @@
+from django.db import connection, models, transaction
+from django.db.models import Sum
+from django.utils import timezone
+from .product import Product
+from .stock_movement import StockMovement
+
+
+class StockSnapshot(models.Model):
+    """
+    Foto periódica do estoque de todos os produtos (manage.py
+    snapshot_stock). Ponto de partida para responder "qual era o
+    estoque na data X" sem percorrer o livro de movimentações inteiro.
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE,
+        related_name="stock_snapshots", verbose_name="Produto"
+    )
+    taken_at = models.DateTimeField(verbose_name="Registrado em")
+    stock = models.IntegerField(verbose_name="Estoque")
+
+    @staticmethod
+    def take():
+        """
+        Grava o estoque atual de todos os produtos num único
+        INSERT ... SELECT e retorna (taken_at, quantidade de produtos).
+
+        A tabela de produtos fica em SHARE MODE durante a foto: vendas
+        em andamento terminam antes dela e as novas esperam, então toda
+        movimentação com created_at <= taken_at já está na foto e
+        nenhuma posterior está.
+        """
+        product_table = connection.ops.quote_name(Product._meta.db_table)
+        snapshot_table = connection.ops.quote_name(StockSnapshot._meta.db_table)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {product_table} IN SHARE MODE")
+            taken_at = timezone.now()
+            cursor.execute(
+                f"INSERT INTO {snapshot_table} (product_id, taken_at, stock) "
+                f"SELECT id, %s, stock FROM {product_table}",
+                [taken_at],
+            )
+            count = cursor.rowcount
+
+        return taken_at, count
+
+    @staticmethod
+    def stock_at(product_id: int, when):
+        """
+        Estoque do produto no instante `when`.
+
+        Parte da foto mais próxima (antes ou depois de `when`) e soma
+        ou desconta só as movimentações entre ela e `when`. Sem nenhuma
+        foto, parte do estoque atual e desconta o que veio depois.
+        """
+        snapshots = StockSnapshot.objects.filter(product_id=product_id)
+        before = (
+            snapshots.filter(taken_at__lte=when)
+            .order_by("-taken_at").values("taken_at", "stock").first()
+        )
+        after = (
+            snapshots.filter(taken_at__gt=when)
+            .order_by("taken_at").values("taken_at", "stock").first()
+        )
+
+        movements = StockMovement.objects.filter(product_id=product_id)
+
+        def total(queryset):
+            return queryset.aggregate(total=Sum("quantity"))["total"] or 0
+
+        if before and (not after or when - before["taken_at"] <= after["taken_at"] - when):
+            return before["stock"] + total(
+                movements.filter(created_at__gt=before["taken_at"], created_at__lte=when)
+            )
+
+        if after:
+            return after["stock"] - total(
+                movements.filter(created_at__gt=when, created_at__lte=after["taken_at"])
+            )
+
+        current = Product.objects.values_list("stock", flat=True).get(pk=product_id)
+        return current - total(movements.filter(created_at__gt=when))
+
+    def __str__(self):
+        return f"{self.product_id}: {self.stock} em {self.taken_at:%d/%m/%Y %H:%M}"
+
+    class Meta:
+        verbose_name = "Foto de Estoque"
+        verbose_name_plural = "Fotos de Estoque"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "taken_at"],
+                name="stock_snapshot_unique",
+            ),
+        ]
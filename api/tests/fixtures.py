@@ -0,0 +1,72 @@
+from decimal import Decimal
+from ..models import Category, Customer, PaymentMethod, Product, Sale, SaleItem, User
+from ..utils.catalog_cache import catalog_cache
+from ..utils.reference_cache import reference_cache
+
+
+def reset_caches():
+    """Descarta os caches em memória entre testes."""
+    catalog_cache.invalidate()
+    reference_cache.invalidate()
+
+
+def make_user(username="caixa", role="checkout") -> User:
+    user = User.objects.create_user(username, f"{username}@example.com", "senha")
+    user.role = role
+    user.save()
+    return user
+
+
+def make_customer() -> Customer:
+    # Sale.customer tem default=1 (consumidor final)
+    customer, _ = Customer.objects.get_or_create(
+        id=1, defaults={"name": "Consumidor Final", "phone": ""}
+    )
+    return customer
+
+
+def make_payment_method(**fields) -> PaymentMethod:
+    fields.setdefault("name", "Dinheiro")
+    fields.setdefault("type", "cash")
+    return PaymentMethod.objects.create(**fields)
+
+
+def make_products(count: int, stock: int = 100, category: Category = None) -> list[Product]:
+    category = category or Category.objects.create(
+        name=f"Categoria {Category.objects.count() + 1}",
+        price_tier_1=Decimal("10.00"),
+        price_tier_2=Decimal("9.00"),
+        price_tier_3=Decimal("8.00"),
+        quantity_limit_1=10,
+        quantity_limit_2=50,
+    )
+    return [
+        Product.objects.create(
+            name=f"Produto {n}",
+            stock=stock,
+            category=category,
+            barcode=f"{category.id:04d}{n:08d}",
+        )
+        for n in range(count)
+    ]
+
+
+def make_pending_sale(payment_method: PaymentMethod, lines) -> Sale:
+    """Venda concluída ainda não finalizada (estoque não baixado)."""
+    make_customer()
+    sale = Sale.objects.create(
+        payment_method=payment_method,
+        total_amount=0,
+        paid_amount=0,
+    )
+    SaleItem.objects.bulk_create([
+        SaleItem(
+            sale=sale,
+            product=product,
+            quantity=quantity,
+            unit_price=product.category.price_tier_1,
+            subtotal=product.category.price_tier_1 * quantity,
+        )
+        for product, quantity in lines
+    ])
+    return sale
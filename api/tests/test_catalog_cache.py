@@ -0,0 +1,32 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from ..models.category import Category
+from ..utils.catalog_cache import catalog_cache
+from .fixtures import make_products, reset_caches
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CACHE_VERSION_CHECK_INTERVAL=0)
+class CatalogCacheVersionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_caches()
+        self.category = make_products(1)[0].category
+
+    def test_reference_bump_alone_reloads_catalog_categories(self):
+        cached = catalog_cache.get_category(self.category.id)
+        self.assertEqual(cached.price_tier_1, Decimal("10.00"))
+        generation = catalog_cache.version
+
+        # Outro worker alterou a categoria: só a versão do reference_cache
+        # mudou até agora (a do catálogo ainda não foi percebida)
+        Category.objects.filter(pk=self.category.pk).update(price_tier_1=Decimal("20.00"))
+        cache.incr("reference_cache:version")
+
+        cached = catalog_cache.get_category(self.category.id)
+        self.assertEqual(cached.price_tier_1, Decimal("20.00"))
+        self.assertNotEqual(catalog_cache.version, generation)
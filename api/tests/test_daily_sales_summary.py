@@ -0,0 +1,37 @@
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from ..models import DailySalesSummary, Sale
+from .fixtures import (
+    make_customer, make_payment_method, make_products, make_user, reset_caches,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DailySalesSummaryTests(TestCase):
+    def setUp(self):
+        reset_caches()
+        make_customer()
+        product = make_products(1)[0]
+        self.sale = Sale.checkout(
+            cart=[{"product_id": product.id, "quantity": 2}],
+            payment_method_id=make_payment_method().id,
+            seller=make_user(),
+        )
+
+    def summary(self) -> DailySalesSummary:
+        return DailySalesSummary.objects.get(status="completed")
+
+    def test_checkout_is_summarized(self):
+        self.assertEqual(self.summary().revenue, self.sale.total_amount)
+
+    def test_apply_discount_refreshes_summary(self):
+        self.sale.apply_discount(Decimal("5.00"))
+
+        summary = self.summary()
+        self.assertEqual(summary.revenue, Decimal("15.00"))
+        self.assertEqual(summary.discount, Decimal("5.00"))
+        self.assertEqual(summary.profit, self.sale.profit)
@@ -0,0 +1,85 @@
+import os
+import socket
+import tempfile
+import threading
+from django.test import SimpleTestCase
+from ..utils.escpos import CODEPAGE_CP860, ENCODING, FEED_AND_CUT, INIT, render_escpos_receipt
+from ..utils.printer_backends import EscPosBackend, PrinterError
+
+
+def sale_dict() -> dict:
+    return {
+        "id": 7,
+        "date": "2026-01-01T12:00:00",
+        "customer": {
+            "id": 1, "name": "Consumidor Final", "trade_name": "",
+            "cnpj_or_cpf": "", "phone": "", "address": "",
+        },
+        "total_amount": 37.5,
+        "discount": 0.0,
+        "status": "completed",
+        "payment_method": {"id": 1, "name": "Dinheiro"},
+        "items": [
+            {"id": 1, "product": "Café Torrado 500g", "quantity": 3, "unit_price": 12.5, "subtotal": 37.5},
+        ],
+    }
+
+
+class SocketSink:
+    """Impressora de rede falsa: aceita uma conexão e guarda os bytes."""
+
+    def __init__(self):
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.received = bytearray()
+        self.thread = threading.Thread(target=self._serve)
+        self.thread.start()
+
+    def _serve(self):
+        conn, _ = self.server.accept()
+        with conn:
+            while chunk := conn.recv(65536):
+                self.received.extend(chunk)
+
+    def close(self) -> bytes:
+        self.thread.join(5)
+        self.server.close()
+        return bytes(self.received)
+
+
+class EscPosReceiptTests(SimpleTestCase):
+    def setUp(self):
+        self.data = render_escpos_receipt(sale_dict(), {"money_received": 50.0, "change": 12.5})
+
+    def assertReceipt(self, stream: bytes):
+        self.assertEqual(stream, self.data)
+        self.assertTrue(stream.startswith(INIT + CODEPAGE_CP860))
+        self.assertTrue(stream.endswith(FEED_AND_CUT))
+        for text in ("NÃO É DOCUMENTO FISCAL", "Café Torrado 500g", "R$ 37.50", "Troco:"):
+            self.assertIn(text.encode(ENCODING), stream)
+
+    def test_device_file_sink(self):
+        with tempfile.TemporaryDirectory() as directory:
+            device = os.path.join(directory, "lp0")
+            EscPosBackend().send(self.data, {"device": device})
+            with open(device, "rb") as f:
+                self.assertReceipt(f.read())
+
+    def test_network_socket_sink(self):
+        sink = SocketSink()
+        try:
+            EscPosBackend().send(self.data, {"host": "127.0.0.1", "port": sink.port})
+        finally:
+            stream = sink.close()
+        self.assertReceipt(stream)
+
+    def test_unusable_destination_raises_printer_error(self):
+        for config in ({}, {"device": os.path.join(tempfile.gettempdir(), "nao", "existe")}):
+            with self.subTest(config=config), self.assertRaises(PrinterError):
+                EscPosBackend().send(self.data, config)
+
+    def test_narrow_paper_wraps_text(self):
+        data = render_escpos_receipt(sale_dict(), paper_width_mm=58)
+        self.assertTrue(data.endswith(FEED_AND_CUT))
+        self.assertIn(("-" * 32 + "\n").encode(ENCODING), data)
+        self.assertNotIn(("-" * 48).encode(ENCODING), data)
@@ -0,0 +1,90 @@
+from decimal import Decimal, localcontext
+from django.test import SimpleTestCase
+from hypothesis import given, strategies as st
+from ..models import PaymentMethod, Sale, SaleItem
+from ..utils.money import from_cents, money, multiply, net_of_percent, to_cents
+
+# Valores que cabem nos DecimalField(max_digits=10, decimal_places=2)
+prices = st.decimals(
+    min_value=Decimal("0.01"), max_value=Decimal("99999.99"), places=2,
+)
+quantities = st.integers(min_value=1, max_value=999)
+rates = st.decimals(min_value=Decimal("0"), max_value=Decimal("99.99"), places=2)
+
+
+def exact(value) -> Decimal:
+    """Arredondamento de referência, com precisão de sobra."""
+    with localcontext() as context:
+        context.prec = 60
+        return Decimal(value).quantize(Decimal("0.01"), rounding="ROUND_HALF_UP")
+
+
+class MoneyPropertyTests(SimpleTestCase):
+
+    @given(st.decimals(allow_nan=False, allow_infinity=False, places=6,
+                       min_value=-10**9, max_value=10**9))
+    def test_money_rounds_half_up_to_cents(self, value):
+        result = money(value)
+        self.assertEqual(result.as_tuple().exponent, -2)
+        self.assertEqual(result, exact(value))
+        self.assertEqual(money(result), result)
+
+    @given(st.floats(min_value=-1e6, max_value=1e6, allow_nan=False))
+    def test_floats_convert_by_their_shortest_repr(self, value):
+        self.assertEqual(money(value), exact(repr(value)))
+
+    @given(prices, quantities)
+    def test_multiply_by_quantity_is_exact(self, price, quantity):
+        self.assertEqual(multiply(price, quantity), price * quantity)
+
+    @given(prices)
+    def test_cents_round_trip(self, price):
+        self.assertEqual(from_cents(to_cents(price)), price)
+
+    @given(prices, rates)
+    def test_net_of_percent(self, amount, rate):
+        self.assertEqual(
+            net_of_percent(amount, rate),
+            exact(amount * (100 - rate) / 100),
+        )
+
+    @given(st.lists(st.tuples(prices, quantities), min_size=1, max_size=500), prices)
+    def test_sale_totals_are_bit_exact(self, lines, discount):
+        method = PaymentMethod(internal_fee=Decimal("2.99"))
+        sale = Sale(payment_method=method, discount=discount)
+        items = [SaleItem(unit_price=price, quantity=quantity) for price, quantity in lines]
+        for item in items:
+            item.refresh_subtotal()
+
+        sale.calculate_totals(items)
+
+        gross = sum((price * quantity for price, quantity in lines), Decimal(0))
+        total = max(gross - discount, Decimal(0))
+        self.assertEqual(sale.total_amount, total)
+        self.assertEqual(sale.total_quantity, sum(quantity for _, quantity in lines))
+        self.assertEqual(sale.profit, exact(total * Decimal("0.9701")))
+
+    @given(
+        prices,
+        st.decimals(min_value=Decimal("0.01"), max_value=Decimal("15"), places=2),
+        st.integers(min_value=1, max_value=6),
+        st.integers(min_value=1, max_value=24),
+    )
+    def test_interest_matches_high_precision_reference(self, amount, rate, free, installments):
+        method = PaymentMethod(
+            type="credit", customer_interest_rate=rate,
+            no_interest_installments=free, max_installments=24,
+        )
+        months = max(installments - free, 0)
+        with localcontext() as context:
+            context.prec = 60
+            expected = exact(amount * (1 + rate / 100) ** months)
+
+        self.assertEqual(method.calculate_total_with_interest(amount, installments), expected)
+
+    def test_invalid_values_raise_value_error(self):
+        for value in ("abc", "1e30", "NaN", float("inf"), Decimal("sNaN"), object()):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                money(value)
+        with self.assertRaises(ValueError):
+            multiply("1e27", "1e27")
@@ -0,0 +1,36 @@
+import base64
+import json
+from django.test import SimpleTestCase
+from ..models.user import User
+from ..utils.pagination import InvalidCursor, KeysetPaginator
+
+
+def raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+class KeysetCursorTests(SimpleTestCase):
+    """Cursores adulterados viram InvalidCursor (400), nunca 500."""
+
+    def setUp(self):
+        self.paginator = KeysetPaginator(("last_login", "id"))
+
+    def test_round_trip(self):
+        cursor = self.paginator.encode_cursor(["2026-01-01T00:00:00", 7])
+        self.assertEqual(self.paginator.decode_cursor(cursor), ["2026-01-01T00:00:00", 7])
+
+    def test_rejects_bad_cursors(self):
+        ordering = ["last_login", "id"]
+        for cursor in (
+            "não é base64",
+            raw_cursor([1, 2]),
+            raw_cursor({"o": ordering, "v": 5}),
+            raw_cursor({"o": ordering, "v": "ab"}),
+            raw_cursor({"o": ordering, "v": [None, None]}),
+            raw_cursor({"o": ordering, "v": ["2026-01-01T00:00:00", "abc"]}),
+            raw_cursor({"o": ordering, "v": ["ontem", 1]}),
+            raw_cursor({"o": ordering, "v": ["2026-01-01T00:00:00", [1]]}),
+            raw_cursor({"o": ["id"], "v": [1]}),
+        ):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                self.paginator.paginate(User.objects.all(), cursor)
@@ -0,0 +1,40 @@
+from django.test import RequestFactory, SimpleTestCase
+from ..models.user import User
+from ..views.product_view import ProductView
+from ..views.report_view import ReportView
+from ..views.sale_view import SaleView
+
+
+class PeriodParamsTests(SimpleTestCase):
+    """Parâmetros de período/filtro inválidos viram 400, nunca 500."""
+
+    def get(self, view, **params):
+        request = RequestFactory().get("/", params)
+        request.user = User(id=1, role="admin", is_active=True)
+        return view(request)
+
+    def test_export_rejects_impossible_date(self):
+        response = self.get(SaleView().export_sales, start="2024-02-30", end="2024-03-01")
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_rejects_malformed_date(self):
+        response = self.get(SaleView().export_sales, start="ontem", end="2024-03-01")
+        self.assertEqual(response.status_code, 400)
+
+    def test_report_rejects_impossible_date(self):
+        response = self.get(ReportView().sales_summary, start="2024-02-30")
+        self.assertEqual(response.status_code, 400)
+
+    def test_report_rejects_non_numeric_ids(self):
+        for field in ("seller_id", "payment_method_id"):
+            with self.subTest(field=field):
+                response = self.get(ReportView().sales_summary, **{field: "abc"})
+                self.assertEqual(response.status_code, 400)
+
+    def test_stock_at_rejects_impossible_date(self):
+        for value in ("2024-02-30", "2024-02-30T10:00"):
+            with self.subTest(at=value):
+                response = self.get(
+                    lambda request: ProductView().stock_at(request, 1), at=value,
+                )
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,46 @@
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from ..models import Category, Sale
+from ..models.sale import MAX_QUANTITY
+from ..utils.pricing_engine import pricing_engine
+from .fixtures import make_products, reset_caches
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PricingLimitsTests(TestCase):
+    """Carrinhos fora do intervalo de int64 viram ValidationError, não lixo."""
+
+    def setUp(self):
+        reset_caches()
+        category = Category.objects.create(name="Cara", price_tier_1=Decimal("99999.99"))
+        self.product = make_products(1, category=category)[0]
+        self.category_id = category.id
+
+    def test_total_beyond_int64_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            pricing_engine.price_cart([(self.category_id, 2_000_000_000_000)])
+
+    def test_quantity_beyond_int64_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            pricing_engine.price_cart([(self.category_id, 2 ** 63)])
+
+    def test_preview_beyond_int64_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            pricing_engine.preview_additions([(self.category_id, 2_000_000_000_000)], self.category_id, 5)
+
+    def test_large_total_within_int64_is_exact(self):
+        quote = pricing_engine.price_cart([(self.category_id, MAX_QUANTITY)])
+        self.assertEqual(quote.total, Decimal("99999.99") * MAX_QUANTITY)
+
+    def test_resolve_cart_bounds_quantity(self):
+        for cart in (
+            [{"product_id": self.product.id, "quantity": MAX_QUANTITY + 1}],
+            [{"product_id": self.product.id, "quantity": MAX_QUANTITY}] * 2,
+        ):
+            with self.subTest(cart=cart), self.assertRaises(ValidationError):
+                Sale.resolve_cart(cart)
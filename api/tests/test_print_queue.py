@@ -0,0 +1,137 @@
+import threading
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from ..models import PrintJob
+from ..utils.print_queue import PrintWorker, backoff_delay
+from ..utils.printer_backends import FakePrinterBackend
+from .fixtures import make_payment_method, make_pending_sale, make_products, make_user, reset_caches
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+def make_job(user, **fields) -> PrintJob:
+    sale = make_pending_sale(make_payment_method(), [(make_products(1)[0], 2)])
+    fields.setdefault("printer_name", "FAKE")
+    return PrintJob.objects.create(sale=sale, user=user, **fields)
+
+
+def make_due(job: PrintJob):
+    """Antecipa a próxima tentativa (em vez de esperar o backoff)."""
+    PrintJob.objects.filter(pk=job.pk).update(next_attempt_at=timezone.now())
+
+
+class BackoffDelayTests(SimpleTestCase):
+    def test_doubles_until_the_cap(self):
+        self.assertEqual(
+            [backoff_delay(attempts).total_seconds() for attempts in (1, 2, 3, 9, 50)],
+            [2, 4, 8, 300, 300],
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrintWorkerTests(TestCase):
+    def setUp(self):
+        reset_caches()
+        self.user = make_user()
+
+    def test_prints_through_fake_backend(self):
+        job = make_job(self.user)
+        backend = FakePrinterBackend()
+
+        self.assertTrue(PrintWorker(backend=backend).run_once())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "done")
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.printed_at)
+        [(printer_name, title, pdf)] = backend.jobs
+        self.assertEqual(printer_name, "FAKE")
+        self.assertIn(f"#{job.sale_id}", title)
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+    def test_failure_is_retried_after_backoff(self):
+        job = make_job(self.user)
+        worker = PrintWorker(backend=FakePrinterBackend(fail_times=1))
+
+        before = timezone.now()
+        self.assertTrue(worker.run_once())
+        job.refresh_from_db()
+        self.assertEqual(job.status, "pending")
+        self.assertEqual(job.last_error, "Falha simulada.")
+        self.assertGreaterEqual(job.next_attempt_at, before + backoff_delay(1))
+
+        # Ainda dentro do backoff: nada a fazer
+        self.assertFalse(worker.run_once())
+
+        make_due(job)
+        self.assertTrue(worker.run_once())
+        job.refresh_from_db()
+        self.assertEqual(job.status, "done")
+        self.assertEqual(job.attempts, 2)
+        self.assertIsNone(job.last_error)
+
+    def test_fails_after_max_attempts(self):
+        job = make_job(self.user, max_attempts=2)
+        worker = PrintWorker(backend=FakePrinterBackend(fail_times=10))
+
+        worker.run_once()
+        make_due(job)
+        worker.run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.attempts, 2)
+        make_due(job)
+        self.assertFalse(worker.run_once())
+
+    def test_unknown_printer_is_an_error(self):
+        job = make_job(self.user, printer_name="OUTRA")
+        PrintWorker(backend=FakePrinterBackend()).run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "pending")
+        self.assertIn("OUTRA", job.last_error)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrintWorkerClaimTests(TransactionTestCase):
+    """Dois workers não pegam o mesmo job (SELECT ... FOR UPDATE SKIP LOCKED)."""
+
+    def setUp(self):
+        reset_caches()
+        self.user = make_user()
+
+    def test_claim_skips_locked_job(self):
+        first = make_job(self.user)
+        second = make_job(self.user)
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_first():
+            # Outro worker no meio do claim do primeiro job
+            try:
+                with transaction.atomic():
+                    PrintJob.objects.select_for_update().get(pk=first.pk)
+                    locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=hold_first)
+        thread.start()
+        try:
+            self.assertTrue(locked.wait(10))
+            claimed = PrintWorker(backend=FakePrinterBackend()).claim_next()
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual(claimed.pk, second.pk)
+        claimed.refresh_from_db()
+        self.assertEqual(claimed.status, "printing")
+        self.assertEqual(claimed.attempts, 1)
+        first.refresh_from_db()
+        self.assertEqual(first.status, "pending")
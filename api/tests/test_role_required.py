@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import _get_new_csrf_string
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from ..models.user import User
+from ..utils.auth_cache import token_user_cache
+from ..utils.role_required import role_required
+from .fixtures import make_user
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class _View:
+    @role_required(["admin"])
+    def protected(self, request):
+        return HttpResponse()
+
+
+class SessionCsrfTests(SimpleTestCase):
+    """Usuário de sessão nas views csrf_exempt precisa passar pelo CSRF."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.view = _View()
+
+    def session_request(self, method, **extra):
+        request = getattr(self.factory, method)("/", **extra)
+        request.user = User(id=1, role="admin", is_active=True)
+        return request
+
+    def test_post_without_token_is_rejected(self):
+        response = self.view.protected(self.session_request("post"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_post_with_token_is_accepted(self):
+        token = _get_new_csrf_string()
+        self.factory.cookies["csrftoken"] = token
+        response = self.view.protected(
+            self.session_request("post", HTTP_X_CSRFTOKEN=token)
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_safe_method_does_not_need_token(self):
+        response = self.view.protected(self.session_request("get"))
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CACHE_VERSION_CHECK_INTERVAL=0)
+class TokenUserCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = make_user(role="admin")
+        self.view = _View()
+        self.header = f"Bearer {AccessToken.for_user(self.user)}"
+
+    def call(self):
+        request = RequestFactory().post("/", HTTP_AUTHORIZATION=self.header)
+        request.user = None
+        return self.view.protected(request)
+
+    def test_jwt_post_does_not_need_csrf(self):
+        self.assertEqual(self.call().status_code, 200)
+
+    def test_user_change_invalidates_cached_role(self):
+        self.assertEqual(self.call().status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.role = "checkout"
+            self.user.save()
+        self.assertEqual(self.call().status_code, 403)
+
+    def test_bump_from_another_process_clears_entries(self):
+        self.assertEqual(self.call().status_code, 200)
+        self.assertEqual(len(token_user_cache._entries), 1)
+        # Outro worker incrementa a versão direto no cache compartilhado
+        cache.incr("auth_cache:version")
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.call().status_code, 401)
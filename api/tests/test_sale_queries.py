@@ -0,0 +1,92 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from ..models import Sale
+from .fixtures import (
+    make_payment_method, make_pending_sale, make_products, make_user, reset_caches,
+)
+
+CART_SIZES = (2, 10, 50, 200)
+
+# Versões dos caches em memória fora do banco, para que só as consultas
+# da venda entrem na contagem
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SaleQueryCountTests(TestCase):
+    """
+    O número de consultas de update_items_prices e checkout não pode
+    crescer com o tamanho do carrinho.
+    """
+
+    def setUp(self):
+        self.payment_method = make_payment_method()
+        self.seller = make_user()
+        self.products = make_products(max(CART_SIZES), stock=10_000)
+
+    def count_queries(self, func) -> int:
+        reset_caches()
+        with CaptureQueriesContext(connection) as context:
+            func()
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, build_call):
+        """build_call(tamanho) → função a medir, com os caches frios."""
+        baseline = self.count_queries(build_call(CART_SIZES[0]))
+        for size in CART_SIZES[1:]:
+            call = build_call(size)
+            reset_caches()
+            with self.subTest(cart_size=size), self.assertNumQueries(baseline):
+                call()
+
+    def test_update_items_prices_constant_queries(self):
+        def build(size):
+            sale = make_pending_sale(
+                self.payment_method,
+                [(product, 2) for product in self.products[:size]],
+            )
+            return sale.update_items_prices
+
+        self.assertConstantQueries(build)
+
+    def test_finalize_sale_constant_queries(self):
+        def build(size):
+            sale = make_pending_sale(
+                self.payment_method,
+                [(product, 1) for product in self.products[:size]],
+            )
+            return sale.finalize_sale
+
+        self.assertConstantQueries(build)
+
+    def test_checkout_constant_queries(self):
+        def build(size):
+            # Metade por id, metade por código de barras
+            cart = [
+                {"product_id": product.id, "quantity": 3}
+                if n % 2 else
+                {"barcode": product.barcode, "quantity": 3}
+                for n, product in enumerate(self.products[:size])
+            ]
+            return lambda: Sale.checkout(
+                cart=cart,
+                payment_method_id=self.payment_method.id,
+                seller=self.seller,
+            )
+
+        self.assertConstantQueries(build)
+
+    def test_checkout_prices_every_line(self):
+        cart = [{"product_id": product.id, "quantity": 1} for product in self.products[:60]]
+        sale = Sale.checkout(
+            cart=cart, payment_method_id=self.payment_method.id, seller=self.seller,
+        )
+
+        # 60 unidades passam do quantity_limit_2 (50): faixa 3 em todas
+        self.assertEqual(sale.items.count(), 60)
+        self.assertEqual(set(sale.items.values_list("unit_price", flat=True)), {8})
+        self.assertEqual(sale.total_amount, 480)
+        self.assertEqual(sale.total_quantity, 60)
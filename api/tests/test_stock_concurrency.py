@@ -0,0 +1,144 @@
+import threading
+from django.db import connection
+from django.db.models import Sum
+from django.test import TransactionTestCase
+from ..models import Product, Sale, StockMovement
+from ..models.sale import SaleAlreadyFinalized
+from .fixtures import make_payment_method, make_pending_sale, make_products, reset_caches
+
+
+def run_in_parallel(calls):
+    """
+    Roda cada chamada numa thread própria (cada uma com sua conexão),
+    todas liberadas ao mesmo tempo. Retorna (resultados, erros).
+    """
+    barrier = threading.Barrier(len(calls))
+    results, errors = [], []
+    lock = threading.Lock()
+
+    def worker(call):
+        try:
+            barrier.wait()
+            result = call()
+            with lock:
+                results.append(result)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker, args=(call,)) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def finalize(sale_id):
+    return lambda: Sale.objects.get(pk=sale_id).finalize_sale()
+
+
+def cancel(sale_id):
+    return lambda: Sale.objects.get(pk=sale_id).cancel_sale()
+
+
+class ParallelStockTests(TransactionTestCase):
+    """Baixas de estoque simultâneas nos mesmos produtos (SKUs)."""
+
+    THREADS = 12
+    INITIAL_STOCK = 1000
+
+    def setUp(self):
+        reset_caches()
+        self.payment_method = make_payment_method()
+        self.products = make_products(4, stock=self.INITIAL_STOCK)
+
+    def assertStock(self, expected: dict):
+        stock = dict(
+            Product.objects
+            .filter(id__in=expected)
+            .values_list("id", "stock")
+        )
+        self.assertEqual(stock, expected)
+
+    def test_parallel_finalizations_decrement_exact_stock(self):
+        # Produtos em ordens diferentes em cada venda: força a disputa
+        # pelos mesmos locks e pega deadlock se a ordem não for fixa
+        sales = []
+        for n in range(self.THREADS):
+            lines = [(product, n % 3 + 1) for product in self.products]
+            if n % 2:
+                lines.reverse()
+            sales.append(make_pending_sale(self.payment_method, lines))
+
+        _, errors = run_in_parallel([finalize(sale.id) for sale in sales])
+
+        self.assertEqual(errors, [])
+        sold = sum(n % 3 + 1 for n in range(self.THREADS))
+        self.assertStock({
+            product.id: self.INITIAL_STOCK - sold for product in self.products
+        })
+
+        movements = StockMovement.objects.filter(kind="sale")
+        self.assertEqual(movements.count(), self.THREADS * len(self.products))
+        per_product = dict(
+            movements.order_by().values("product_id")
+            .annotate(total=Sum("quantity"))
+            .values_list("product_id", "total")
+        )
+        self.assertEqual(per_product, {product.id: -sold for product in self.products})
+        self.assertEqual(
+            Sale.objects.filter(finalized_at__isnull=False).count(), self.THREADS
+        )
+
+    def test_same_sale_finalized_in_parallel_decrements_once(self):
+        sale = make_pending_sale(
+            self.payment_method, [(product, 5) for product in self.products]
+        )
+
+        _, errors = run_in_parallel([finalize(sale.id)] * self.THREADS)
+
+        self.assertEqual(len(errors), self.THREADS - 1)
+        self.assertTrue(all(isinstance(e, SaleAlreadyFinalized) for e in errors))
+        self.assertStock({
+            product.id: self.INITIAL_STOCK - 5 for product in self.products
+        })
+        self.assertEqual(
+            StockMovement.objects.filter(sale=sale, kind="sale").count(),
+            len(self.products),
+        )
+
+    def test_same_sale_cancelled_in_parallel_restocks_once(self):
+        sale = make_pending_sale(
+            self.payment_method, [(product, 7) for product in self.products]
+        )
+        sale.finalize_sale()
+
+        _, errors = run_in_parallel([cancel(sale.id)] * self.THREADS)
+
+        self.assertEqual(errors, [])
+        self.assertStock({product.id: self.INITIAL_STOCK for product in self.products})
+        self.assertEqual(
+            StockMovement.objects.filter(sale=sale, kind="cancellation").count(),
+            len(self.products),
+        )
+
+    def test_stock_never_goes_negative(self):
+        product = make_products(1, stock=10)[0]
+        sales = [
+            make_pending_sale(self.payment_method, [(product, 3)])
+            for _ in range(self.THREADS)
+        ]
+
+        _, errors = run_in_parallel([finalize(sale.id) for sale in sales])
+
+        self.assertEqual(errors, [])
+        self.assertStock({product.id: 0})
+        # O livro registra só o que foi de fato baixado
+        self.assertEqual(
+            StockMovement.objects.filter(product=product)
+            .aggregate(total=Sum("quantity"))["total"],
+            -10,
+        )
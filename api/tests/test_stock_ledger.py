@@ -0,0 +1,30 @@
+from django.test import TestCase, override_settings
+from ..models import StockMovement
+from .fixtures import make_payment_method, make_pending_sale, make_products, make_user, reset_caches
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SaleLedgerTests(TestCase):
+    def setUp(self):
+        reset_caches()
+        self.product = make_products(1)[0]
+        self.sale = make_pending_sale(make_payment_method(), [(self.product, 3)])
+        self.sale.seller = make_user()
+        self.sale.save()
+
+    def test_cancellation_records_who_cancelled(self):
+        manager = make_user("gerente", role="manager")
+        self.sale.finalize_sale()
+        self.sale.cancel_sale(user=manager)
+
+        movements = {
+            movement.kind: movement
+            for movement in StockMovement.objects.filter(sale=self.sale)
+        }
+        self.assertEqual(movements["sale"].user, self.sale.seller)
+        self.assertEqual(movements["cancellation"].user, manager)
+        self.assertEqual(movements["cancellation"].quantity, 3)
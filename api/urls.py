@@ -1,4 +1,9 @@
 from .urls_path.user_url import urlpatterns as user_urlpatterns
+from .urls_path.product_url import urlpatterns as product_urlpatterns
+from .urls_path.sale_url import urlpatterns as sale_urlpatterns
+from .urls_path.print_job_url import urlpatterns as print_job_urlpatterns
+from .urls_path.report_url import urlpatterns as report_urlpatterns
+from .urls_path.payment_method_url import urlpatterns as payment_method_urlpatterns
 from .views.online_api import online_api_view
 from django.urls import path, include
 from rest_framework_simplejwt.views import (
@@ -11,4 +16,9 @@ urlpatterns = [
     path('login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('users/', include((user_urlpatterns, 'users'))),
+    path('products/', include((product_urlpatterns, 'products'))),
+    path('sales/', include((sale_urlpatterns, 'sales'))),
+    path('print-jobs/', include((print_job_urlpatterns, 'print_jobs'))),
+    path('reports/', include((report_urlpatterns, 'reports'))),
+    path('payment-methods/', include((payment_method_urlpatterns, 'payment_methods'))),
 ]
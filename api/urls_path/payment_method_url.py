@@ -0,0 +1,12 @@
+from django.urls import path
+from ..views.payment_method_view import PaymentMethodView
+
+payment_method_view = PaymentMethodView()
+
+urlpatterns = [
+    path(
+        '<int:payment_method_id>/installments/',
+        payment_method_view.installments,
+        name='payment_method_installments'
+    ),
+]
@@ -0,0 +1,12 @@
+from django.urls import path
+from ..views.print_job_view import PrintJobView
+
+print_job_view = PrintJobView()
+
+urlpatterns = [
+    path(
+        '<int:job_id>/',
+        print_job_view.get_job,
+        name='print_job_detail'
+    ),
+]
@@ -0,0 +1,27 @@
+from django.urls import path
+from ..views.product_view import ProductView
+
+product_view = ProductView()
+
+urlpatterns = [
+    path(
+        'barcode/<str:barcode>/',
+        product_view.get_by_barcode,
+        name='product_by_barcode'
+    ),
+    path(
+        'reorder/',
+        product_view.reorder,
+        name='product_reorder'
+    ),
+    path(
+        'stock-movements/',
+        product_view.move_stock,
+        name='product_stock_movements'
+    ),
+    path(
+        '<int:product_id>/stock-at/',
+        product_view.stock_at,
+        name='product_stock_at'
+    ),
+]
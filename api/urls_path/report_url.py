@@ -0,0 +1,12 @@
+from django.urls import path
+from ..views.report_view import ReportView
+
+report_view = ReportView()
+
+urlpatterns = [
+    path(
+        'sales-summary/',
+        report_view.sales_summary,
+        name='report_sales_summary'
+    ),
+]
@@ -0,0 +1,32 @@
+from django.urls import path
+from ..views.sale_view import SaleView
+
+sale_view = SaleView()
+
+urlpatterns = [
+    path(
+        'checkout/',
+        sale_view.checkout,
+        name='sale_checkout'
+    ),
+    path(
+        'quote/',
+        sale_view.quote,
+        name='sale_quote'
+    ),
+    path(
+        'export/',
+        sale_view.export_sales,
+        name='sale_export'
+    ),
+    path(
+        '<int:sale_id>/finalize/',
+        sale_view.finalize_sale,
+        name='sale_finalize'
+    ),
+    path(
+        '<int:sale_id>/cancel/',
+        sale_view.cancel_sale,
+        name='sale_cancel'
+    ),
+]
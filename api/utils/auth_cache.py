@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from ..models.user import User
+from .shared_version import SharedVersion
+
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 1024
+
+
+class TokenUserCache:
+    """
+    Cache LRU (por processo) de token JWT → (id, role, is_active).
+
+    Um token já validado não precisa ter a assinatura conferida nem o
+    usuário buscado no banco de novo a cada requisição. As entradas
+    vivem no máximo CACHE_TTL_SECONDS (nunca além do exp do token).
+
+    Salvar ou excluir um usuário incrementa a versão compartilhada
+    (SharedVersion), e cada processo descarta o seu LRU ao perceber a
+    mudança, em até CACHE_VERSION_CHECK_INTERVAL segundos. Assim um
+    usuário desativado ou rebaixado perde o acesso em todos os workers.
+    """
+
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared = SharedVersion("auth_cache:version")
+        self._version = None
+        self._jwt = JWTAuthentication()
+
+    def authenticate(self, request):
+        """
+        Igual a JWTAuthentication.authenticate, mas consultando o cache.
+        Retorna o usuário ou None se não houver token.
+        Levanta as exceções do SimpleJWT para token inválido.
+        """
+        header = self._jwt.get_header(request)
+        if header is None:
+            return None
+        raw_token = self._jwt.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        version = self._shared.get()
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(raw_token)
+            if entry is not None:
+                if entry[3] > now:
+                    self._entries.move_to_end(raw_token)
+                    return self._build_user(*entry[:3])
+                del self._entries[raw_token]
+
+        validated_token = self._jwt.get_validated_token(raw_token)
+        user = self._jwt.get_user(validated_token)
+
+        expires_at = now + min(
+            self.ttl,
+            max(validated_token["exp"] - time.time(), 0),
+        )
+        with self._lock:
+            if version != self._version:
+                # Invalidado enquanto o token era validado: não guarda
+                return user
+            self._entries[raw_token] = (user.id, user.role, user.is_active, expires_at)
+            self._entries.move_to_end(raw_token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return user
+
+    def invalidate(self):
+        """Invalida o cache deste processo e de todos os outros."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._shared.bump()
+
+    @staticmethod
+    def _build_user(user_id: int, role: str, is_active: bool) -> User:
+        # Instância com os demais campos adiados: só vai ao banco se a
+        # view usar outro campo, e save() grava apenas o que foi carregado.
+        return User.from_db(
+            DEFAULT_DB_ALIAS,
+            ["id", "role", "is_active"],
+            [user_id, role, is_active],
+        )
+
+
+token_user_cache = TokenUserCache()
+
+
+@receiver(post_save, sender=User)
+def _user_saved(sender, update_fields=None, **kwargs):
+    # Registrar o último login não altera papel nem situação do usuário
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    transaction.on_commit(token_user_cache.invalidate)
+
+
+@receiver(post_delete, sender=User)
+def _user_deleted(sender, **kwargs):
+    transaction.on_commit(token_user_cache.invalidate)
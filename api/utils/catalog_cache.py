@@ -0,0 +1,186 @@
+import threading
+import time
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from ..models.category import Category
+from ..models.product import Product
+from ..models.tag import Tag
+from .reference_cache import reference_cache
+from .shared_version import SharedVersion, local_cache_ttl
+
+
+class CatalogCache:
+    """
+    Cache em memória (por processo) do catálogo usado no caixa.
+
+    - Categorias (com as faixas de preço) vêm do reference_cache.
+    - Produtos são carregados sob demanda, por id ou barcode, já com a
+      categoria do cache anexada (product.category não faz consulta).
+
+    Cada processo guarda a versão que carregou; a versão "oficial" fica
+    no cache do Django (SharedVersion) e é incrementada pelos signals
+    de Product, Category e Tag. Quando as versões divergem o processo
+    descarta tudo e recarrega, assim vários workers convergem. Mesmo
+    sem invalidação o conteúdo é recarregado após LOCAL_CACHE_TTL.
+
+    As categorias vêm do reference_cache, que percebe a própria versão
+    no seu tempo; por isso o carregamento guarda também a versão do
+    reference_cache e recarrega quando qualquer uma das duas muda
+    (senão faixas de preço antigas ficariam sob a versão nova).
+
+    Atenção: o estoque dos produtos em cache pode estar defasado, pois
+    as baixas de estoque não invalidam o cache. Use apenas para preço
+    e dados cadastrais.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._shared = SharedVersion("catalog_cache:version")
+        self._version = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._categories = {}
+        self._products = {}
+        self._barcodes = {}
+
+    # -----------------------
+    # VERSIONAMENTO
+    # -----------------------
+
+    def _sync(self):
+        """Descarta o conteúdo local se a versão mudou ou se expirou."""
+        version = (self._shared.get(), reference_cache.version)
+        if version == self._version and time.monotonic() < self._expires_at:
+            return
+
+        with self._lock:
+            if version == self._version and time.monotonic() < self._expires_at:
+                return
+            self._categories = reference_cache.get_categories()
+            self._products = {}
+            self._barcodes = {}
+            self._version = version
+            self._expires_at = time.monotonic() + local_cache_ttl()
+            self._generation += 1
+
+    def invalidate(self):
+        """Invalida o cache deste processo e de todos os outros."""
+        with self._lock:
+            self._version = None
+            self._shared.bump()
+
+    @property
+    def version(self):
+        """Identifica o carregamento atual deste processo (após sincronizar)."""
+        self._sync()
+        return self._generation
+
+    # -----------------------
+    # CONSULTAS
+    # -----------------------
+
+    def get_category(self, category_id: int) -> Category | None:
+        self._sync()
+        return self._categories.get(category_id)
+
+    def get_categories(self) -> dict[int, Category]:
+        self._sync()
+        return dict(self._categories)
+
+    def get_product(self, product_id: int) -> Product | None:
+        return self.get_products([product_id]).get(product_id)
+
+    def get_products(self, product_ids) -> dict[int, Product]:
+        """
+        Retorna {id: produto} para os ids informados.
+        Os que faltam no cache são carregados numa única consulta.
+        """
+        self._sync()
+        missing = [pk for pk in set(product_ids) if pk not in self._products]
+        if missing:
+            self._load_products(Product.objects.filter(id__in=missing))
+
+        return {
+            pk: self._products[pk]
+            for pk in product_ids
+            if pk in self._products
+        }
+
+    def get_product_by_barcode(self, barcode: str) -> Product | None:
+        barcode = (barcode or "").strip()
+        return self.get_products_by_barcode([barcode]).get(barcode)
+
+    def get_products_by_barcode(self, barcodes) -> dict[str, Product]:
+        """
+        Retorna {barcode: produto} para os códigos informados.
+        Os que faltam no cache são carregados numa única consulta.
+        """
+        barcodes = {(barcode or "").strip() for barcode in barcodes} - {""}
+        if not barcodes:
+            return {}
+
+        self._sync()
+        missing = [barcode for barcode in barcodes if barcode not in self._barcodes]
+        if missing:
+            self._load_products(Product.objects.filter(barcode__in=missing))
+
+        return {
+            barcode: self._products[self._barcodes[barcode]]
+            for barcode in barcodes
+            if barcode in self._barcodes
+        }
+
+    def get_category_for_product(self, product_id: int) -> Category | None:
+        product = self.get_product(product_id)
+        return product.category if product else None
+
+    def _load_products(self, queryset):
+        products = queryset.only(
+            "id", "name", "barcode", "stock", "category_id",
+        )
+        with self._lock:
+            for product in products:
+                category = self._categories.get(product.category_id)
+                if category is None:
+                    # Categoria criada depois do último carregamento
+                    category = reference_cache.get_category(product.category_id)
+                    self._categories[category.id] = category
+                product.category = category
+                self._products[product.id] = product
+                if product.barcode:
+                    self._barcodes[product.barcode] = product.id
+
+
+catalog_cache = CatalogCache()
+
+
+# -----------------------
+# INVALIDAÇÃO (signals)
+# -----------------------
+
+def _invalidate_on_commit():
+    transaction.on_commit(catalog_cache.invalidate)
+
+
+@receiver(post_save, sender=Product)
+def _product_saved(sender, instance, update_fields=None, **kwargs):
+    # Baixa/reposição de estoque não altera preço nem cadastro
+    if update_fields is not None and set(update_fields) <= {"stock", "updated_at"}:
+        return
+    _invalidate_on_commit()
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def _catalog_changed(sender, **kwargs):
+    _invalidate_on_commit()
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def _product_tags_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        _invalidate_on_commit()
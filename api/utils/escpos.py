@@ -0,0 +1,194 @@
+import os
+import textwrap
+from django.conf import settings
+from PIL import Image, ImageOps
+from ..types.sales_types import SaleDict, ChangeDict
+from .file_cache import FileCache
+from .receipt_generator import get_store_info
+
+# ============================================================
+# COMANDOS ESC/POS
+# ============================================================
+ESC = b"\x1b"
+GS = b"\x1d"
+
+INIT = ESC + b"@"
+CODEPAGE_CP860 = ESC + b"t\x03"  # Português
+ALIGN_LEFT = ESC + b"a\x00"
+ALIGN_CENTER = ESC + b"a\x01"
+BOLD_ON = ESC + b"E\x01"
+BOLD_OFF = ESC + b"E\x00"
+SIZE_NORMAL = GS + b"!\x00"
+SIZE_DOUBLE = GS + b"!\x11"
+FEED_AND_CUT = ESC + b"d\x04" + GS + b"V\x42\x00"
+
+ENCODING = "cp860"
+
+# Largura útil (pontos a 203 dpi e colunas na fonte A) por papel
+PAPER_DOTS = {80: 576, 58: 384}
+PAPER_COLUMNS = {80: 48, 58: 32}
+
+LOGO_PATH = os.path.join(settings.BASE_DIR, "public", "logo_store.png")
+LOGO_MAX_DOTS = 400  # ~50 mm, mesma largura do logo no PDF
+
+
+# ============================================================
+# LOGO (raster pré-processado)
+# ============================================================
+def logo_raster(image: Image.Image, max_width: int) -> bytes:
+    """
+    Converte a imagem para o comando GS v 0 (raster 1 bit):
+    escala para no máximo max_width pontos (múltiplo de 8) e aplica
+    dithering Floyd–Steinberg.
+    """
+    image = image.convert("L")
+    width = min(image.width, max_width) // 8 * 8
+    height = max(round(image.height * width / image.width), 1)
+    image = image.resize((width, height))
+
+    # No modo "1" do Pillow o bit 1 é branco; na impressora, preto.
+    bitmap = ImageOps.invert(image).convert("1")
+    data = bitmap.tobytes()
+
+    width_bytes = width // 8
+    return (
+        GS + b"v0\x00"
+        + bytes([width_bytes % 256, width_bytes // 256])
+        + bytes([height % 256, height // 256])
+        + data
+    )
+
+
+def _logo_loader(max_width: int):
+    def load(path):
+        if not os.path.exists(path):
+            return None
+        with Image.open(path) as image:
+            return logo_raster(image, max_width)
+    return load
+
+
+# Um cache por largura de papel; recalcula só se o PNG mudar
+_logo_files = {
+    paper: FileCache(LOGO_PATH, _logo_loader(min(LOGO_MAX_DOTS, dots)))
+    for paper, dots in PAPER_DOTS.items()
+}
+
+
+# ============================================================
+# COMPROVANTE
+# ============================================================
+def render_escpos_receipt(
+    sale_data: SaleDict,
+    change: ChangeDict = None,
+    paper_width_mm: int = 80,
+) -> bytes:
+    """
+    Gera o comprovante (mesmo conteúdo do PDF) direto em comandos
+    ESC/POS, em modo texto, sem passar pelo ReportLab nem pelo driver.
+    """
+    paper = 58 if paper_width_mm <= 58 else 80
+    columns = PAPER_COLUMNS[paper]
+    separator = "-" * columns
+    out = bytearray()
+
+    def raw(command: bytes):
+        out.extend(command)
+
+    def write(text: str = ""):
+        for line in textwrap.wrap(text, columns) or [""]:
+            out.extend(line.encode(ENCODING, errors="replace"))
+            out.extend(b"\n")
+
+    def write_centered(text: str):
+        raw(ALIGN_CENTER)
+        write(text)
+        raw(ALIGN_LEFT)
+
+    def write_pair(left: str, right: str):
+        space = max(columns - len(left) - len(right), 1)
+        write(left + " " * space + right)
+
+    raw(INIT)
+    raw(CODEPAGE_CP860)
+
+    # ================================
+    # LOGO
+    # ================================
+    logo = _logo_files[paper].get()
+    if logo is not None:
+        raw(ALIGN_CENTER)
+        raw(logo)
+        raw(b"\n")
+        raw(ALIGN_LEFT)
+
+    # ================================
+    # HEADERS
+    # ================================
+    store = get_store_info()
+    raw(SIZE_DOUBLE + BOLD_ON)
+    write_centered(store.get("store_name", "Stock Plus"))
+    raw(SIZE_NORMAL + BOLD_OFF)
+    write_centered("-=-=- Comprovante de Venda -=-=-")
+    write_centered("NÃO É DOCUMENTO FISCAL")
+    write(separator)
+
+    if store.get("fantasy_name"):
+        write_centered(store["fantasy_name"])
+    if store.get("cnpj"):
+        write_centered(f"CNPJ: {store['cnpj']}")
+    if store.get("address"):
+        write_centered(store["address"])
+    if store.get("phone"):
+        write_centered(f"Tel: {store['phone']}")
+
+    write(separator)
+
+    # ================================
+    # CLIENTE
+    # ================================
+    customer = sale_data["customer"]
+    if customer["id"] == 1:
+        write("Cliente: Avulso")
+    else:
+        write(f"Razão: {customer['name']}")
+        write(f"Fantasia: {customer['trade_name']}")
+        write(f"CPF/CNPJ: {customer['cnpj_or_cpf']}")
+        write(f"Endereço: {customer['address']}")
+
+    write(separator)
+
+    # ================================
+    # PRODUTOS
+    # ================================
+    raw(BOLD_ON)
+    write_centered("Produtos")
+    raw(BOLD_OFF)
+
+    for item in sale_data["items"]:
+        write(item["product"])
+        write_pair(
+            f"{item['quantity']} x R$ {item['unit_price']:.2f}",
+            f"R$ {item['subtotal']:.2f}",
+        )
+
+    write(separator)
+
+    # ================================
+    # RESUMO
+    # ================================
+    write_pair("Desconto:", f"R$ {sale_data['discount']:.2f}")
+    raw(BOLD_ON)
+    write_pair("TOTAL:", f"R$ {sale_data['total_amount']:.2f}")
+    raw(BOLD_OFF)
+    write_pair("Pagamento:", sale_data["payment_method"]["name"])
+
+    if change:
+        write_pair("Recebido:", f"R$ {change['money_received']:.2f}")
+        write_pair("Troco:", f"R$ {change['change']:.2f}")
+
+    write(separator)
+    write_centered("Obrigado pela preferência!")
+
+    raw(FEED_AND_CUT)
+    return bytes(out)
@@ -0,0 +1,44 @@
+import os
+import threading
+
+
+class FileCache:
+    """
+    Mantém em memória o resultado de loader(path) e só chama o loader
+    de novo quando o arquivo muda (mtime ou tamanho) ou passa a
+    existir/deixa de existir.
+
+    Exceções do loader não são engolidas: quem quiser um valor padrão
+    para arquivo ausente ou inválido trata isso dentro do loader.
+    """
+
+    def __init__(self, path, loader):
+        self.path = path
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._signature = ()
+        self._value = None
+
+    def _current_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self):
+        signature = self._current_signature()
+        if signature == self._signature:
+            return self._value
+
+        with self._lock:
+            if signature != self._signature:
+                self._value = self.loader(self.path)
+                self._signature = signature
+        return self._value
+
+    def clear(self):
+        """Esquece o valor carregado: o próximo get() chama o loader."""
+        with self._lock:
+            self._signature = ()
+            self._value = None
@@ -0,0 +1,123 @@
+import hashlib
+from datetime import timedelta
+from functools import wraps
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from ..models.idempotency_key import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def _fingerprint(request) -> str:
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\n")
+    digest.update(request.get_full_path().encode())
+    digest.update(b"\n")
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def _replay(record: IdempotencyKey) -> HttpResponse:
+    response = HttpResponse(
+        record.response_body,
+        status=record.status_code,
+        content_type=record.content_type,
+    )
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def idempotent(view_func):
+    """
+    Torna a view idempotente quando o cliente envia o header
+    Idempotency-Key (sem o header a view roda normalmente).
+
+    A chave é gravada na mesma transação da operação:
+    - Uma retentativa recebe a resposta armazenada, sem tocar em
+      Sale/Product de novo.
+    - Retentativas simultâneas esperam a primeira terminar (índice
+      único) e então recebem a resposta dela.
+    - Respostas 5xx não são guardadas (a transação é desfeita).
+    - A mesma chave com outro corpo/caminho responde 422.
+
+    Deve ser aplicado abaixo de role_required (precisa de request.user).
+    """
+
+    @wraps(view_func)
+    def _wrapped_view(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_func(self, request, *args, **kwargs)
+
+        if len(key) > 255:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Idempotency-Key too long.'
+                },
+                status=400
+            )
+
+        fingerprint = _fingerprint(request)
+        now = timezone.now()
+
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    record = IdempotencyKey.objects.create(
+                        key=key,
+                        user=request.user,
+                        fingerprint=fingerprint,
+                        status_code=0,
+                        content_type="",
+                        response_body="",
+                        expires_at=now + timedelta(
+                            seconds=settings.IDEMPOTENCY_KEY_TTL
+                        ),
+                    )
+            except IntegrityError:
+                record = IdempotencyKey.objects.select_for_update().get(
+                    key=key, user=request.user,
+                )
+                if record.expires_at > now:
+                    if record.fingerprint != fingerprint:
+                        return JsonResponse(
+                            {
+                                'status': 'error',
+                                'message': 'Idempotency-Key reused with a different request.'
+                            },
+                            status=422
+                        )
+                    return _replay(record)
+
+                # Chave expirada: reaproveita o registro
+                record.fingerprint = fingerprint
+                record.expires_at = now + timedelta(
+                    seconds=settings.IDEMPOTENCY_KEY_TTL
+                )
+
+            response = view_func(self, request, *args, **kwargs)
+
+            if response.status_code >= 500:
+                transaction.set_rollback(True)
+                return response
+
+            record.status_code = response.status_code
+            record.content_type = response.get("Content-Type", "")
+            record.response_body = response.content.decode(response.charset)
+            record.save()
+
+        return response
+
+    return _wrapped_view
+
+
+def purge_expired_keys() -> int:
+    """Remove as chaves expiradas. Retorna quantas foram removidas."""
+    deleted, _ = IdempotencyKey.objects.filter(
+        expires_at__lte=timezone.now()
+    ).delete()
+    return deleted
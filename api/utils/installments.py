@@ -0,0 +1,73 @@
+import threading
+from .money import MONEY_CONTEXT, money, multiply
+from .reference_cache import reference_cache
+
+
+class InstallmentPlanCache:
+    """
+    Tabelas de fatores de parcelamento por método de pagamento, em
+    memória (por processo). Com a tabela pronta, montar as opções de
+    1..max_installments é só uma multiplicação por opção, sem potência
+    nem consulta ao banco.
+
+    Os métodos vêm do reference_cache e as tabelas são descartadas
+    sempre que ele recarrega (método salvo ou apagado em qualquer
+    processo, ou LOCAL_CACHE_TTL vencido).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._plans = {}
+
+    def get(self, payment_method_id: int):
+        """
+        Retorna (método, fatores) de um método ativo, ou None.
+        fatores[n - 1] multiplica o valor para n parcelas.
+        """
+        version = reference_cache.version
+        with self._lock:
+            if version != self._version:
+                self._plans = {}
+                self._version = version
+            plan = self._plans.get(payment_method_id)
+
+        if plan is None:
+            method = reference_cache.get_active_payment_method(payment_method_id)
+            if method is None:
+                return None
+            plan = (method, tuple(method.installment_factors()))
+            with self._lock:
+                if version == self._version:
+                    self._plans[payment_method_id] = plan
+        return plan
+
+    def schedule(self, payment_method_id: int, amount) -> list[dict] | None:
+        """
+        Todas as opções de parcelamento do valor: total com juros e
+        valor de cada parcela. Abaixo de min_installment_amount só há
+        pagamento à vista. None se o método não existir ou estiver inativo.
+        """
+        plan = self.get(payment_method_id)
+        if plan is None:
+            return None
+
+        method, factors = plan
+        amount = money(amount)
+        if method.min_installment_amount and amount < method.min_installment_amount:
+            factors = factors[:1]
+
+        free = method.no_interest_installments or 1
+        options = []
+        for installments, factor in enumerate(factors, start=1):
+            total = multiply(amount, factor)
+            options.append({
+                "installments": installments,
+                "total": total,
+                "installment_amount": money(MONEY_CONTEXT.divide(total, installments)),
+                "interest_free": installments <= free or factor == 1,
+            })
+        return options
+
+
+installment_plans = InstallmentPlanCache()
@@ -0,0 +1,97 @@
+from decimal import Context, Decimal, InvalidOperation, ROUND_HALF_UP
+
+CENT = Decimal("0.01")
+HUNDRED = Decimal(100)
+
+# Contexto único para toda a conta de dinheiro: precisão folgada para
+# juros compostos (ex.: 1,0299^24) e arredondamento comercial
+MONEY_CONTEXT = Context(prec=28, rounding=ROUND_HALF_UP)
+
+
+def to_decimal(value) -> Decimal:
+    """
+    Converte para Decimal sem herdar o erro binário de float
+    (0.1 vira Decimal("0.1"), não 0.1000000000000000055...).
+    Valores inválidos levantam ValueError, como float().
+    """
+    if type(value) is Decimal:
+        return value
+    if value is None:
+        return Decimal(0)
+    if isinstance(value, float):
+        value = repr(value)
+    try:
+        result = Decimal(value)
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Valor monetário inválido: {value!r}")
+    if not result.is_finite():
+        raise ValueError(f"Valor monetário inválido: {value!r}")
+    return result
+
+
+def _round_cents(value: Decimal) -> Decimal:
+    # quantize levanta InvalidOperation quando o valor não cabe na
+    # precisão do contexto (ex.: 1e30); para quem chama é um valor
+    # inválido como outro qualquer
+    try:
+        result = value.quantize(CENT, context=MONEY_CONTEXT)
+    except ArithmeticError:
+        raise ValueError(f"Valor monetário fora do limite: {value}")
+    if not result.is_finite():
+        raise ValueError(f"Valor monetário inválido: {value}")
+    return result
+
+
+def money(value) -> Decimal:
+    """
+    Valor em reais arredondado para centavos (meio para cima).
+    Levanta ValueError para valores inválidos ou grandes demais.
+    """
+    return _round_cents(to_decimal(value))
+
+
+def multiply(amount, factor) -> Decimal:
+    """amount × factor, arredondado uma única vez ao final."""
+    if type(amount) is not Decimal:
+        amount = to_decimal(amount)
+    try:
+        if type(factor) is int:
+            # Caminho quente (preço × quantidade em cada linha): o produto
+            # por inteiro é exato até 28 dígitos e, acima disso, o
+            # quantize abaixo levanta; dispensa a chamada ao contexto
+            product = amount * factor
+        else:
+            product = MONEY_CONTEXT.multiply(amount, to_decimal(factor))
+        result = product.quantize(CENT, context=MONEY_CONTEXT)
+    except ArithmeticError:
+        raise ValueError(f"Valor monetário fora do limite: {amount} × {factor}")
+    if result.is_nan():
+        raise ValueError(f"Valor monetário inválido: {amount} × {factor}")
+    return result
+
+
+def percent_of(amount, rate) -> Decimal:
+    """rate% de amount (ex.: taxa da operadora), em centavos."""
+    return multiply(amount, MONEY_CONTEXT.divide(to_decimal(rate), HUNDRED))
+
+
+def net_of_percent(amount, rate) -> Decimal:
+    """amount descontado de rate% (ex.: lucro líquido da taxa), em centavos."""
+    factor = MONEY_CONTEXT.divide(MONEY_CONTEXT.subtract(HUNDRED, to_decimal(rate)), HUNDRED)
+    return multiply(amount, factor)
+
+
+def compound_factor(monthly_rate, months: int) -> Decimal:
+    """(1 + taxa/100) ** meses, sem arredondar."""
+    base = MONEY_CONTEXT.add(1, MONEY_CONTEXT.divide(to_decimal(monthly_rate), HUNDRED))
+    return MONEY_CONTEXT.power(base, months)
+
+
+def to_cents(value) -> int:
+    """Valor em reais → centavos inteiros."""
+    return int(money(value).scaleb(2))
+
+
+def from_cents(cents) -> Decimal:
+    """Centavos inteiros → Decimal com duas casas."""
+    return Decimal(int(cents)).scaleb(-2)
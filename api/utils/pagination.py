@@ -0,0 +1,125 @@
+import base64
+import json
+from dataclasses import dataclass
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """Cursor de paginação malformado ou de outra ordenação."""
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Paginação por cursor (keyset): em vez de OFFSET, cada página começa
+    logo depois da última linha da anterior, com um WHERE que o índice
+    da ordenação atende. O custo por página é constante, não importa
+    quantas linhas a tabela tenha.
+
+    ordering: campos da ordenação, ex. ("id",) ou ("name", "id").
+    O último campo precisa ser único (normalmente o id).
+    Prefixo "-" ordena de forma decrescente, ex. ("-date", "-id").
+
+    Uso:
+        paginator = KeysetPaginator(("username", "id"))
+        page = paginator.paginate(queryset, cursor, limit)
+    """
+
+    def __init__(self, ordering, default_limit: int = 50, max_limit: int = 200):
+        self.ordering = tuple(ordering)
+        self.fields = tuple(field.lstrip("-") for field in self.ordering)
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+    # -----------------------
+    # CURSOR
+    # -----------------------
+
+    def encode_cursor(self, values) -> str:
+        payload = json.dumps(
+            {"o": self.ordering, "v": list(values)}, cls=DjangoJSONEncoder
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> list:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            values = payload["v"]
+            ordering = tuple(payload["o"])
+        except (ValueError, TypeError, KeyError):
+            raise InvalidCursor("Cursor inválido.")
+
+        if (
+            ordering != self.ordering
+            or not isinstance(values, list)
+            or len(values) != len(self.fields)
+        ):
+            raise InvalidCursor("Cursor não corresponde à ordenação.")
+        return values
+
+    # -----------------------
+    # FILTRO
+    # -----------------------
+
+    def _after(self, values) -> Q:
+        """
+        WHERE para "linhas depois de values" na ordenação:
+        (a > va) OR (a = va AND b > vb) OR ...
+        """
+        condition = Q()
+        equal = Q()
+        for order, field, value in zip(self.ordering, self.fields, values):
+            lookup = "lt" if order.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+        return condition
+
+    def _bound(self, values) -> Q:
+        # Limite redundante no primeiro campo: deixa o planner fazer
+        # um range scan no índice em vez de avaliar o OR linha a linha.
+        lookup = "lte" if self.ordering[0].startswith("-") else "gte"
+        return Q(**{f"{self.fields[0]}__{lookup}": values[0]})
+
+    def paginate(self, queryset, cursor: str | None = None, limit=None) -> Page:
+        try:
+            limit = int(limit) if limit else self.default_limit
+        except (TypeError, ValueError):
+            limit = self.default_limit
+        limit = max(1, min(limit, self.max_limit))
+
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            values = self.decode_cursor(cursor)
+            try:
+                queryset = queryset.filter(self._bound(values)).filter(self._after(values))
+            except (ValueError, TypeError, ValidationError):
+                # Cursor bem formado com valores do tipo errado (ex.: texto
+                # ou null num campo numérico): o filter() recusa ao montar
+                raise InvalidCursor("Cursor inválido.")
+
+        # Uma linha a mais só para saber se existe próxima página
+        rows = list(queryset[:limit + 1])
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = self.encode_cursor(
+                [
+                    last[field] if isinstance(last, dict) else getattr(last, field)
+                    for field in self.fields
+                ]
+            )
+
+        return Page(items=rows, next_cursor=next_cursor)
@@ -0,0 +1,230 @@
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+import numpy as np
+from django.core.exceptions import ValidationError
+from .catalog_cache import catalog_cache
+from .money import from_cents, to_cents
+
+NO_LIMIT = np.iinfo(np.int64).max
+# Maior total (centavos) que a conta vetorizada em int64 comporta
+MAX_CENTS = np.iinfo(np.int64).max
+
+
+def _quantities(lines) -> np.ndarray:
+    """
+    Quantidades das linhas em int64. Recusa carrinhos cuja soma não
+    caberia em int64 (np.add.at estouraria em silêncio).
+    """
+    values = [quantity for _, quantity in lines]
+    if max(values, default=0) * len(values) > MAX_CENTS and sum(values) > MAX_CENTS:
+        raise ValidationError("Quantidade muito grande.")
+    return np.array(values, dtype=np.int64)
+
+
+def _check_totals(bound: int, exact_totals):
+    """
+    Recusa totais (centavos) que não cabem em int64. `bound` é uma cota
+    superior barata (maior preço × maior quantidade); só quando ela
+    passa do limite os totais exatos, em inteiros do Python, são
+    calculados por exact_totals(). Se nenhum total passa, nenhum
+    subtotal passa e a conta em int64 é exata.
+    """
+    if bound > MAX_CENTS and max(exact_totals(), default=0) > MAX_CENTS:
+        raise ValidationError("Valor do carrinho excede o limite permitido.")
+
+
+@dataclass
+class CartQuote:
+    total_quantity: int
+    unit_prices: list[Decimal]
+    subtotals: list[Decimal]
+    total: Decimal
+
+
+class PricingTable:
+    """
+    Faixas de preço de todas as categorias em vetores NumPy (centavos),
+    indexados pela posição da categoria em `index`.
+
+    Os limites já vêm "efetivos": faixa sem preço ou sem limite recebe
+    NO_LIMIT, então a regra de Category.get_price_for_quantity vira
+
+        preço = p3 se qtd > lim2, senão p2 se qtd > lim1, senão p1
+    """
+
+    def __init__(self, categories):
+        categories = list(categories)
+        self.index = {category.id: pos for pos, category in enumerate(categories)}
+        self.tier_1 = np.array(
+            [to_cents(c.price_tier_1) for c in categories], dtype=np.int64,
+        )
+        self.tier_2 = np.array(
+            [to_cents(c.price_tier_2) for c in categories], dtype=np.int64,
+        )
+        self.tier_3 = np.array(
+            [to_cents(c.price_tier_3) for c in categories], dtype=np.int64,
+        )
+        self.limit_1 = np.array(
+            [
+                c.quantity_limit_1
+                if c.price_tier_2 is not None and c.quantity_limit_1 else NO_LIMIT
+                for c in categories
+            ],
+            dtype=np.int64,
+        )
+        self.limit_2 = np.array(
+            [
+                c.quantity_limit_2
+                if c.price_tier_3 is not None and c.quantity_limit_2 else NO_LIMIT
+                for c in categories
+            ],
+            dtype=np.int64,
+        )
+
+    def positions(self, category_ids) -> np.ndarray:
+        return np.fromiter(
+            (self.index[pk] for pk in category_ids),
+            dtype=np.intp,
+            count=len(category_ids),
+        )
+
+    def unit_prices(self, positions, cart_quantities) -> np.ndarray:
+        """
+        Preço unitário (centavos) de cada linha. `positions` e
+        `cart_quantities` são vetores com broadcast entre si.
+        """
+        return np.where(
+            cart_quantities > self.limit_2[positions],
+            self.tier_3[positions],
+            np.where(
+                cart_quantities > self.limit_1[positions],
+                self.tier_2[positions],
+                self.tier_1[positions],
+            ),
+        )
+
+
+class CartPricingEngine:
+    """
+    Precifica carrinhos inteiros numa passada vetorizada.
+
+    A tabela de faixas é montada uma vez a partir das categorias do
+    catalog_cache e refeita quando a versão do catálogo muda. Todo o
+    cálculo é em centavos inteiros e o resultado volta em Decimal
+    exato (mesmos valores de Category.get_price_for_quantity).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._table = None
+
+    def table(self, category_ids=()) -> PricingTable:
+        """
+        Tabela atual. Refeita se o catálogo mudou ou se falta alguma das
+        categorias pedidas (criada depois da última montagem).
+        """
+        version = catalog_cache.version
+        table = self._table
+        if (
+            table is not None
+            and version == self._version
+            and all(pk in table.index for pk in category_ids)
+        ):
+            return table
+
+        with self._lock:
+            if (
+                self._table is None
+                or version != self._version
+                or not all(pk in self._table.index for pk in category_ids)
+            ):
+                self._table = PricingTable(catalog_cache.get_categories().values())
+                self._version = version
+            return self._table
+
+    def price_cart(self, lines) -> CartQuote:
+        """lines: [(category_id, quantidade), ...]"""
+        return self.price_carts([lines])[0]
+
+    def price_carts(self, carts) -> list[CartQuote]:
+        """
+        Precifica vários carrinhos (ex.: simulações de orçamento) de uma
+        vez. Cada carrinho é uma lista de (category_id, quantidade); a
+        faixa de cada linha depende da quantidade total do seu carrinho.
+
+        Levanta ValidationError se algum total não couber em int64.
+        """
+        flat = [line for lines in carts for line in lines]
+        table = self.table({category_id for category_id, _ in flat})
+        sizes = np.fromiter((len(lines) for lines in carts), dtype=np.intp, count=len(carts))
+
+        positions = table.positions([category_id for category_id, _ in flat])
+        quantities = _quantities(flat)
+        owners = np.repeat(np.arange(len(carts)), sizes)
+
+        cart_quantities = np.zeros(len(carts), dtype=np.int64)
+        np.add.at(cart_quantities, owners, quantities)
+
+        unit_prices = table.unit_prices(positions, cart_quantities[owners])
+
+        def exact_totals():
+            totals = [0] * len(carts)
+            for owner, price, quantity in zip(
+                owners.tolist(), unit_prices.tolist(), quantities.tolist(),
+            ):
+                totals[owner] += price * quantity
+            return totals
+
+        _check_totals(
+            int(unit_prices.max(initial=0)) * int(cart_quantities.max(initial=0)),
+            exact_totals,
+        )
+        subtotals = unit_prices * quantities
+        totals = np.zeros(len(carts), dtype=np.int64)
+        np.add.at(totals, owners, subtotals)
+
+        quotes = []
+        start = 0
+        for cart, size in enumerate(sizes.tolist()):
+            end = start + size
+            quotes.append(CartQuote(
+                total_quantity=int(cart_quantities[cart]),
+                unit_prices=[from_cents(c) for c in unit_prices[start:end].tolist()],
+                subtotals=[from_cents(c) for c in subtotals[start:end].tolist()],
+                total=from_cents(totals[cart]),
+            ))
+            start = end
+        return quotes
+
+    def preview_additions(self, lines, category_id: int, max_extra: int) -> list[Decimal]:
+        """
+        Total do carrinho se forem adicionadas 1..max_extra unidades de
+        um produto da categoria `category_id` (prévia "e se eu levar mais
+        N?"). Todas as opções saem de uma única conta matricial.
+        """
+        if max_extra < 1:
+            return []
+
+        table = self.table({pk for pk, _ in lines} | {category_id})
+        positions = table.positions([pk for pk, _ in lines])
+        quantities = _quantities(list(lines) + [(category_id, max_extra)])[:-1]
+        extra = np.arange(1, max_extra + 1, dtype=np.int64)
+        cart_quantities = int(quantities.sum()) + extra
+
+        # (max_extra, linhas): cada linha repreçada para cada opção
+        current = table.unit_prices(positions[None, :], cart_quantities[:, None])
+        added = table.unit_prices(table.positions([category_id]), cart_quantities)
+        _check_totals(
+            max(int(current.max(initial=0)), int(added.max())) * int(cart_quantities[-1]),
+            lambda: [
+                sum(p * q for p, q in zip(row, quantities.tolist())) + a * e
+                for row, a, e in zip(current.tolist(), added.tolist(), extra.tolist())
+            ],
+        )
+        totals = (current * quantities).sum(axis=1) + added * extra
+        return [from_cents(c) for c in totals.tolist()]
+
+
+pricing_engine = CartPricingEngine()
@@ -0,0 +1,154 @@
+import time
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from ..models.print_job import PrintJob
+from ..models.sale import Sale
+from .escpos import render_escpos_receipt
+from .money import money
+from .printer_backends import EscPosBackend, PrinterBackend, get_default_backend
+from .printer_loader import load_printer_for_user
+from .receipt_generator import render_sale_receipt
+from .sale_converter import sales_to_dicts
+
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 300
+# Job em "printing" há mais tempo que isso volta para a fila (worker caiu)
+STALE_PRINTING_SECONDS = 300
+
+
+def normalize_change(change) -> dict | None:
+    """
+    Valida o troco informado no caixa antes de guardá-lo no job: os
+    comprovantes formatam os valores com :.2f, então um valor não
+    numérico falharia em todas as tentativas de impressão.
+    Levanta ValueError se o troco for inválido.
+    """
+    if not change:
+        return None
+    if not isinstance(change, dict) or not {"money_received", "change"} <= change.keys():
+        raise ValueError("Troco inválido.")
+    return {
+        "money_received": float(money(change["money_received"])),
+        "change": float(money(change["change"])),
+    }
+
+
+def enqueue_sale_receipt(sale, user_id: int, change=None) -> PrintJob:
+    """
+    Enfileira a impressão do comprovante da venda na impressora
+    configurada para o usuário. Retorna imediatamente.
+
+    Chame dentro da mesma transação que cria a venda. Levanta
+    PrinterConfigError se o printer.json estiver inválido e ValueError
+    se o troco não for numérico.
+    """
+    change = normalize_change(change)
+    config = load_printer_for_user(user_id)
+    return PrintJob.objects.create(
+        sale=sale,
+        user_id=user_id,
+        printer_name=config.get("print_name"),
+        interface=config.get("interface", "system"),
+        change=change,
+    )
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Espera exponencial entre tentativas: 2s, 4s, 8s... até 5 min."""
+    seconds = min(BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)), BACKOFF_MAX_SECONDS)
+    return timedelta(seconds=seconds)
+
+
+class PrintWorker:
+    """
+    Consome a fila de PrintJob. Vários workers podem rodar ao mesmo
+    tempo: cada job é reservado com SELECT ... FOR UPDATE SKIP LOCKED.
+    O backend (e a conexão com o CUPS) vive enquanto o worker viver;
+    jobs com interface "escpos" vão direto para a térmica.
+    """
+
+    def __init__(
+        self,
+        backend: PrinterBackend = None,
+        escpos_backend: EscPosBackend = None,
+    ):
+        self.backend = backend
+        self.escpos_backend = escpos_backend or EscPosBackend()
+
+    def claim_next(self) -> PrintJob | None:
+        now = timezone.now()
+        stale = now - timedelta(seconds=STALE_PRINTING_SECONDS)
+        with transaction.atomic():
+            job = (
+                PrintJob.objects
+                .select_for_update(skip_locked=True)
+                .filter(
+                    Q(status="pending", next_attempt_at__lte=now) |
+                    Q(status="printing", updated_at__lt=stale)
+                )
+                .order_by("next_attempt_at", "id")
+                .first()
+            )
+            if job is None:
+                return None
+
+            job.status = "printing"
+            job.attempts += 1
+            job.save(update_fields=["status", "attempts", "updated_at"])
+            return job
+
+    def process(self, job: PrintJob):
+        try:
+            self.print_job(job)
+        except Exception as e:
+            job.last_error = str(e)
+            if job.attempts >= job.max_attempts:
+                job.status = "failed"
+            else:
+                job.status = "pending"
+                job.next_attempt_at = timezone.now() + backoff_delay(job.attempts)
+        else:
+            job.status = "done"
+            job.last_error = None
+            job.printed_at = timezone.now()
+
+        job.save(update_fields=[
+            "status", "last_error", "next_attempt_at", "printed_at", "updated_at",
+        ])
+
+    def print_job(self, job: PrintJob):
+        sale_data = sales_to_dicts(Sale.objects.filter(pk=job.sale_id))[0]
+
+        # Térmicas ESC/POS: bytes direto para a porta, sem PDF
+        if job.interface == "escpos":
+            config = load_printer_for_user(job.user_id or 0)
+            data = render_escpos_receipt(
+                sale_data, job.change, config.get("paper_width_mm", 80)
+            )
+            self.escpos_backend.send(data, config)
+            return
+
+        if self.backend is None:
+            self.backend = get_default_backend()
+        # O backend cuida do arquivo temporário (no Windows a impressão
+        # é assíncrona e o arquivo não pode ser apagado na hora)
+        self.backend.print_pdf(
+            job.printer_name,
+            render_sale_receipt(sale_data, job.change),
+            f"Stock Plus - Venda #{job.sale_id}",
+        )
+
+    def run_once(self) -> bool:
+        """Processa um job, se houver. Retorna True se processou."""
+        job = self.claim_next()
+        if job is None:
+            return False
+        self.process(job)
+        return True
+
+    def run_forever(self, poll_interval: float = 1.0):
+        while True:
+            if not self.run_once():
+                time.sleep(poll_interval)
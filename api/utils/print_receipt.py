@@ -1,8 +1,7 @@
 import os
-import platform
-import cups
-import win32print
-import win32api
+from ..types.sales_types import SaleDict, ChangeDict
+from .escpos import render_escpos_receipt
+from .printer_backends import EscPosBackend, PrinterError, get_default_backend
 
 
 def print_pdf(
@@ -13,85 +12,64 @@ def print_pdf(
     """
     Imprime um PDF usando:
     - interface="system": impressão padrão do SO (Windows/macOS/Linux)
-    - interface="escpos": reservado para impressoras térmicas direto na porta
+    - interface="escpos": não se aplica a PDF; use print_escpos_receipt
 
     path: caminho do PDF
     printer_name: nome da impressora
     Retorna True/False.
+
+    Roda de forma síncrona; no caixa prefira enfileirar com
+    print_queue.enqueue_sale_receipt.
     """
 
     if not os.path.exists(path):
         print(f"❌ Arquivo não encontrado: {path}")
         return False
 
-    system = platform.system()
-
     # ============================================================
-    # ESC/POS (para futuro)
+    # ESC/POS (não imprime PDF)
     # ============================================================
     if interface == "escpos":
-        print("⚠ interface ESC/POS ainda não implementada.")
+        print("⚠ Impressoras ESC/POS usam print_escpos_receipt.")
         return False
 
     # ============================================================
-    # WINDOWS
+    # SISTEMA (Windows / Linux / macOS)
     # ============================================================
-    if system == "Windows":
-        try:
-            printers = win32print.EnumPrinters(2)
-            real_printer_name = ""
-
-            for printer in printers:
-                if printer[2] == printer_name:
-                    real_printer_name = printer[2]
-
-            if real_printer_name == "":
-                raise Exception(
-                    f"A impressora '{printer_name}' não existe no sistema."
-                )
-
-            win32print.SetDefaultPrinter(real_printer_name)
-            win32api.ShellExecute(
-                0,
-                "print",
-                path,
-                None,
-                ".",
-                0
-            )
+    try:
+        job_id = get_default_backend().print_file(
+            printer_name, path, "Impressão Stock Plus"
+        )
+    except PrinterError as e:
+        print(f"❌ {e}")
+        return False
 
-            print(f"🖨 Enviado para impressão: {printer_name or '[DEFAULT]'}")
-            return True
+    print(
+        f"🖨 Enviado para impressão: {printer_name or '[DEFAULT]'} "
+        f"(job id: {job_id})"
+    )
+    return True
 
-        except Exception as e:
-            print(f"❌ Erro ao imprimir no Windows: {e}")
-            return False
 
-    # ============================================================
-    # LINUX / MACOS
-    # ============================================================
-    if system in ["Linux", "Darwin"]:
-        try:
-            conn = cups.Connection()
-            printers = conn.getPrinters()
-
-            if printer_name not in printers:
-                raise Exception(
-                    f"A impressora '{printer_name}' não existe no sistema."
-                )
-
-            # Envia o arquivo PDF para a impressora
-            print_id = conn.printFile(
-                printer_name, path, "Impressão Stock Plus", {}
-            )
-            print(
-                f"🖨 Enviado para impressão: {printer_name} "
-                f"(job id: {print_id})"
-            )
-            return True
-        except Exception as e:
-            print(f"❌ Erro ao imprimir no Linux/Mac: {e}")
-            return False
+def print_escpos_receipt(
+    sale_data: SaleDict,
+    config: dict,
+    change: ChangeDict = None,
+) -> bool:
+    """
+    Imprime o comprovante direto em ESC/POS (impressoras térmicas),
+    sem gerar PDF. config é a entrada do printer.json do usuário
+    ("device" ou "host"/"port", "paper_width_mm").
+    Retorna True/False.
+    """
+    data = render_escpos_receipt(
+        sale_data, change, config.get("paper_width_mm", 80)
+    )
+    try:
+        EscPosBackend().send(data, config)
+    except PrinterError as e:
+        print(f"❌ {e}")
+        return False
 
-    print("⚠ Sistema operacional não suportado.")
-    return False
+    print(f"🖨 Enviado para impressão (ESC/POS): {config.get('print_name')}")
+    return True
@@ -0,0 +1,237 @@
+import os
+import platform
+import socket
+import tempfile
+import threading
+import time
+
+# Windows: PDFs entregues ao ShellExecute ficam aqui até envelhecer
+SPOOL_DIR = os.path.join(tempfile.gettempdir(), "stockplus_spool")
+SPOOL_MAX_AGE_SECONDS = 600
+
+
+class PrinterError(Exception):
+    """Falha ao enviar um job para a impressora."""
+
+
+class PrinterBackend:
+    """
+    Interface dos backends de impressão.
+    print_file envia o arquivo e retorna um identificador do job
+    (ou levanta PrinterError).
+    """
+
+    def print_file(self, printer_name: str, path: str, title: str):
+        raise NotImplementedError
+
+    def print_pdf(self, printer_name: str, pdf: bytes, title: str):
+        """
+        Imprime o PDF em memória. O backend cuida do arquivo temporário:
+        aqui a impressão é síncrona (o arquivo já foi lido quando
+        print_file retorna), então ele é apagado logo em seguida.
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
+            temp_pdf.write(pdf)
+        try:
+            return self.print_file(printer_name, temp_pdf.name, title)
+        finally:
+            os.remove(temp_pdf.name)
+
+
+class CupsBackend(PrinterBackend):
+    """
+    Linux/macOS via CUPS. Mantém a conexão aberta e a lista de
+    impressoras em cache (renovada a cada refresh_interval segundos ou
+    quando a impressora pedida não aparece na lista).
+    """
+
+    def __init__(self, refresh_interval: float = 60):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._conn = None
+        self._printers = None
+        self._printers_loaded_at = 0.0
+
+    def _connection(self):
+        if self._conn is None:
+            import cups
+            self._conn = cups.Connection()
+        return self._conn
+
+    def _load_printers(self):
+        self._printers = set(self._connection().getPrinters())
+        self._printers_loaded_at = time.monotonic()
+
+    def has_printer(self, printer_name: str) -> bool:
+        expired = (
+            time.monotonic() - self._printers_loaded_at > self.refresh_interval
+        )
+        if self._printers is None or expired or printer_name not in self._printers:
+            self._load_printers()
+        return printer_name in self._printers
+
+    def print_file(self, printer_name: str, path: str, title: str):
+        with self._lock:
+            try:
+                if not self.has_printer(printer_name):
+                    raise PrinterError(
+                        f"A impressora '{printer_name}' não existe no sistema."
+                    )
+                return self._connection().printFile(printer_name, path, title, {})
+            except PrinterError:
+                raise
+            except Exception as e:
+                # Conexão pode ter caído: reconecta na próxima tentativa
+                self._conn = None
+                self._printers = None
+                raise PrinterError(f"Erro ao imprimir no Linux/Mac: {e}") from e
+
+
+class WindowsBackend(PrinterBackend):
+    """Windows via spooler (ShellExecute "print")."""
+
+    def __init__(self, refresh_interval: float = 60):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._printers = None
+        self._printers_loaded_at = 0.0
+
+    def _load_printers(self):
+        import win32print
+        self._printers = {printer[2] for printer in win32print.EnumPrinters(2)}
+        self._printers_loaded_at = time.monotonic()
+
+    def has_printer(self, printer_name: str) -> bool:
+        expired = (
+            time.monotonic() - self._printers_loaded_at > self.refresh_interval
+        )
+        if self._printers is None or expired or printer_name not in self._printers:
+            self._load_printers()
+        return printer_name in self._printers
+
+    def print_file(self, printer_name: str, path: str, title: str):
+        import win32api
+        import win32print
+
+        with self._lock:
+            try:
+                if not self.has_printer(printer_name):
+                    raise PrinterError(
+                        f"A impressora '{printer_name}' não existe no sistema."
+                    )
+                win32print.SetDefaultPrinter(printer_name)
+                win32api.ShellExecute(0, "print", path, None, ".", 0)
+                return None
+            except PrinterError:
+                raise
+            except Exception as e:
+                self._printers = None
+                raise PrinterError(f"Erro ao imprimir no Windows: {e}") from e
+
+    def print_pdf(self, printer_name: str, pdf: bytes, title: str):
+        """
+        ShellExecute só dispara o leitor de PDF e retorna na hora; o
+        arquivo não pode ser apagado logo depois (o leitor ainda nem o
+        abriu, ou o mantém aberto). Ele fica em SPOOL_DIR e é removido
+        numa chamada futura, depois de SPOOL_MAX_AGE_SECONDS.
+        """
+        os.makedirs(SPOOL_DIR, exist_ok=True)
+        self._purge_spool()
+        with tempfile.NamedTemporaryFile(
+            dir=SPOOL_DIR, delete=False, suffix=".pdf"
+        ) as temp_pdf:
+            temp_pdf.write(pdf)
+
+        try:
+            return self.print_file(printer_name, temp_pdf.name, title)
+        except PrinterError:
+            # Nada foi disparado: pode apagar já
+            _remove_quietly(temp_pdf.name)
+            raise
+
+    @staticmethod
+    def _purge_spool():
+        limit = time.time() - SPOOL_MAX_AGE_SECONDS
+        for entry in os.scandir(SPOOL_DIR):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < limit:
+                    os.remove(entry.path)
+            except OSError:
+                # Ainda aberto pelo leitor de PDF: tenta na próxima
+                pass
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class FakePrinterBackend(PrinterBackend):
+    """
+    Impressora falsa para testes e desenvolvimento: guarda os bytes
+    impressos em memória. fail_times faz as primeiras N chamadas falharem.
+    """
+
+    def __init__(self, printers=("FAKE",), fail_times: int = 0):
+        self.printers = set(printers)
+        self.fail_times = fail_times
+        self.jobs = []
+
+    def print_file(self, printer_name: str, path: str, title: str):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise PrinterError("Falha simulada.")
+        if printer_name not in self.printers:
+            raise PrinterError(
+                f"A impressora '{printer_name}' não existe no sistema."
+            )
+        with open(path, "rb") as f:
+            self.jobs.append((printer_name, title, f.read()))
+        return len(self.jobs)
+
+
+class EscPosBackend:
+    """
+    Envia bytes ESC/POS direto para a impressora térmica, conforme a
+    configuração do printer.json:
+    - "host" (e "port", padrão 9100): impressora de rede (RAW/JetDirect)
+    - "device": arquivo de dispositivo (ex.: /dev/usb/lp0, COM3)
+    """
+
+    def __init__(self, timeout: float = 5):
+        self.timeout = timeout
+
+    def send(self, data: bytes, config: dict):
+        try:
+            if config.get("host"):
+                address = (config["host"], int(config.get("port") or 9100))
+                with socket.create_connection(address, timeout=self.timeout) as conn:
+                    conn.sendall(data)
+            elif config.get("device"):
+                with open(config["device"], "wb") as device:
+                    device.write(data)
+            else:
+                raise PrinterError(
+                    "Configuração ESC/POS sem 'host' ou 'device'."
+                )
+        except OSError as e:
+            raise PrinterError(f"Erro ao imprimir via ESC/POS: {e}") from e
+
+
+_default_backend = None
+
+
+def get_default_backend() -> PrinterBackend:
+    """Backend do sistema operacional atual (instância única por processo)."""
+    global _default_backend
+    if _default_backend is None:
+        system = platform.system()
+        if system == "Windows":
+            _default_backend = WindowsBackend()
+        elif system in ["Linux", "Darwin"]:
+            _default_backend = CupsBackend()
+        else:
+            raise PrinterError("Sistema operacional não suportado.")
+    return _default_backend
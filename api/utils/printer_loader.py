@@ -1,14 +1,21 @@
 import os
 import json
 from django.conf import settings
+from .file_cache import FileCache
 
 PRINTER_FILE = "printer.json"
 
+PAPER_WIDTHS_MM = (58, 80)
+INTERFACES = ("system", "escpos")
 
-def load_printer_for_user(user_id: int):
+
+class PrinterConfigError(ValueError):
+    """printer.json inválido (JSON malformado ou entrada inconsistente)."""
+
+
+class PrinterRegistry:
     """
-    Carrega impressora do usuário a partir de:
-    public/printer.json
+    Configurações de impressora por usuário, lidas de public/printer.json.
 
     Formato esperado:
     {
@@ -22,44 +29,119 @@ def load_printer_for_user(user_id: int):
             "print_name": "MINHA_EPSON",
             "paper_width_mm": 80,
             "interface": "system"
+        },
+        "3": {
+            "user": { "id": 3, "name": "Caixa 2" },
+            "print_name": "TERMICA_CAIXA_2",
+            "paper_width_mm": 80,
+            "interface": "escpos",
+            "host": "192.168.0.50", "port": 9100
         }
     }
+
+    Para interface "escpos" informe "host" (e "port") ou "device"
+    (ex.: "/dev/usb/lp0").
+
+    O arquivo é lido e validado uma vez e só é relido quando muda
+    (mtime/tamanho). Erros de validação levantam PrinterConfigError
+    em vez de cair silenciosamente na impressora padrão.
     """
 
-    public_dir = os.path.join(settings.BASE_DIR, "public")
-    file_path = os.path.join(public_dir, PRINTER_FILE)
+    def __init__(self, path: str):
+        self._file = FileCache(path, self._parse)
+
+    def get(self, user_id: int) -> dict:
+        configs = self._file.get()
+
+        # Config do usuário, senão DEFAULT, senão o fallback final
+        return (
+            configs.get(str(user_id))
+            or configs.get("DEFAULT")
+            or _default_config()
+        )
+
+    def all(self) -> dict:
+        return dict(self._file.get())
+
+    @staticmethod
+    def _parse(path: str) -> dict:
+        if not os.path.exists(path):
+            print("⚠ printer.json não encontrado, usando impressora padrão.")
+            return {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError as e:
+            raise PrinterConfigError(f"printer.json inválido: {e}") from e
 
-    # -------------------------------
-    # Carrega JSON
-    # -------------------------------
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        print("⚠ printer.json não encontrado ou inválido!")
-        return _default_config()
+        if not isinstance(data, dict):
+            raise PrinterConfigError(
+                "printer.json deve ser um objeto indexado pelo id do usuário."
+            )
 
-    # -------------------------------
-    # Se existir config por usuário
-    # -------------------------------
-    str_id = str(user_id)
-    if str_id in data:
-        return data[str_id]
+        errors = []
+        for key, entry in data.items():
+            errors.extend(
+                f"printer.json[{key!r}]: {error}"
+                for error in _validate_entry(entry)
+            )
+        if errors:
+            raise PrinterConfigError("\n".join(errors))
 
-    # -------------------------------
-    # Senão retorna o DEFAULT
-    # -------------------------------
-    if "DEFAULT" in data:
-        return data["DEFAULT"]
+        return data
 
-    # Fallback final
-    return _default_config()
+
+def _validate_entry(entry) -> list[str]:
+    if not isinstance(entry, dict):
+        return ["a entrada deve ser um objeto."]
+
+    errors = []
+    if entry.get("paper_width_mm", 80) not in PAPER_WIDTHS_MM:
+        errors.append(
+            f"paper_width_mm deve ser um de {PAPER_WIDTHS_MM}, "
+            f"recebido {entry.get('paper_width_mm')!r}."
+        )
+
+    interface = entry.get("interface", "system")
+    if interface not in INTERFACES:
+        errors.append(
+            f"interface deve ser um de {INTERFACES}, recebido {interface!r}."
+        )
+
+    if interface == "system":
+        print_name = entry.get("print_name")
+        if not isinstance(print_name, str) or not print_name.strip():
+            errors.append("print_name é obrigatório para interface 'system'.")
+
+    if interface == "escpos":
+        if not entry.get("host") and not entry.get("device"):
+            errors.append("interface 'escpos' exige 'host' ou 'device'.")
+        port = entry.get("port")
+        if port is not None and not isinstance(port, int):
+            errors.append(f"port deve ser inteiro, recebido {port!r}.")
+
+    return errors
+
+
+printer_registry = PrinterRegistry(
+    os.path.join(settings.BASE_DIR, "public", PRINTER_FILE)
+)
+
+
+def load_printer_for_user(user_id: int):
+    """
+    Retorna a configuração de impressora do usuário (ou a DEFAULT).
+    Consulta em memória; o printer.json só é relido quando muda.
+    Levanta PrinterConfigError se o arquivo estiver inválido.
+    """
+    return printer_registry.get(user_id)
 
 
 def _default_config():
     """
     Configuração de impressora padrão caso
-    o arquivo JSON não exista ou esteja inválido.
+    o arquivo JSON não exista.
     """
 
     return {
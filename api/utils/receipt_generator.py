@@ -1,15 +1,54 @@
 import os
+import io
 import json
-import tempfile
 from django.conf import settings
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
 from ..types.sales_types import SaleDict, ChangeDict
+from .file_cache import FileCache
 
+PUBLIC_DIR = os.path.join(settings.BASE_DIR, "public")
 
-def generate_sale_receipt(sale_data: SaleDict, change: ChangeDict = None):
+DEFAULT_STORE = {
+    "store_name": "Stock Plus",
+    "fantasy_name": "",
+    "cnpj": "",
+    "address": "",
+    "phone": ""
+}
+
+
+def _load_store(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return DEFAULT_STORE
+
+
+def _load_logo(path):
+    # Decodifica o PNG uma única vez; o ImageReader guarda os pixels
+    # e é reaproveitado em todos os comprovantes.
+    if not os.path.exists(path):
+        return None
+    return ImageReader(path)
+
+
+# Recarregados apenas quando o arquivo muda (mtime/tamanho)
+_store_file = FileCache(os.path.join(PUBLIC_DIR, "inf_store.json"), _load_store)
+_logo_file = FileCache(os.path.join(PUBLIC_DIR, "logo_store.png"), _load_logo)
+
+
+def get_store_info() -> dict:
+    """Dados da loja (public/inf_store.json), recarregados só se o arquivo mudar."""
+    return _store_file.get()
+
+
+def render_sale_receipt(sale_data: SaleDict, change: ChangeDict = None) -> bytes:
     """
-    IDENTICO ao seu, apenas com altura dinâmica automática.
+    Renderiza o comprovante em memória e retorna os bytes do PDF,
+    com altura dinâmica automática.
     """
 
     # ======================================================
@@ -31,22 +70,8 @@ def generate_sale_receipt(sale_data: SaleDict, change: ChangeDict = None):
     count_line()
     count_line()
 
-    store = None
-    PUBLIC_DIR = os.path.join(settings.BASE_DIR, "public")
-    info_path = os.path.join(PUBLIC_DIR, "inf_store.json")
-    logo_path = os.path.join(PUBLIC_DIR, "logo_store.png")
-
-    try:
-        with open(info_path, "r", encoding="utf-8") as f:
-            store = json.load(f)
-    except:
-        store = {
-            "store_name": "Stock Plus",
-            "fantasy_name": "",
-            "cnpj": "",
-            "address": "",
-            "phone": ""
-        }
+    store = get_store_info()
+    logo = _logo_file.get()
 
     # linhas opcionais do header
     if store.get("fantasy_name"):
@@ -95,8 +120,8 @@ def generate_sale_receipt(sale_data: SaleDict, change: ChangeDict = None):
     # ======================================================
     # 3️⃣ GERAR O PDF (seu código original)
     # ======================================================
-    temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    c = canvas.Canvas(temp_pdf.name, pagesize=(receipt_width, receipt_height))
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(receipt_width, receipt_height))
 
     y = receipt_height - 10 * mm
 
@@ -116,11 +141,11 @@ def generate_sale_receipt(sale_data: SaleDict, change: ChangeDict = None):
     # ================================
     # LOGO PNG (mesmo que antes)
     # ================================
-    if os.path.exists(logo_path):
+    if logo is not None:
         logo_w = 50 * mm
         logo_h = 25 * mm
         c.drawImage(
-            logo_path,
+            logo,
             (receipt_width - logo_w) / 2,
             y - logo_h,
             width=logo_w,
@@ -190,4 +215,4 @@ def generate_sale_receipt(sale_data: SaleDict, change: ChangeDict = None):
     c.showPage()
     c.save()
 
-    return temp_pdf.name
+    return buffer.getvalue()
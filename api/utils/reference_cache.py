@@ -0,0 +1,125 @@
+import threading
+import time
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from ..models.category import Category
+from ..models.payment_method import PaymentMethod
+from .shared_version import SharedVersion, local_cache_ttl
+
+
+class ReferenceDataCache:
+    """
+    Tabelas de referência pequenas e quase estáticas (métodos de
+    pagamento e categorias) inteiras em memória, por processo.
+
+    Mesmo esquema do catalog_cache: a versão "oficial" (SharedVersion)
+    é incrementada pelos signals de PaymentMethod e Category; quando
+    diverge da versão carregada, ou após LOCAL_CACHE_TTL, o processo
+    recarrega as duas tabelas (duas consultas).
+
+    Os objetos são compartilhados entre requisições: use só para
+    leitura, nunca altere e salve um objeto vindo daqui.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._shared = SharedVersion("reference_cache:version")
+        self._version = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._payment_methods = {}
+        self._categories = {}
+
+    # -----------------------
+    # VERSIONAMENTO
+    # -----------------------
+
+    def _sync(self):
+        """Recarrega as tabelas se a versão mudou ou se expiraram."""
+        version = self._shared.get()
+        if version == self._version and time.monotonic() < self._expires_at:
+            return
+
+        with self._lock:
+            if version == self._version and time.monotonic() < self._expires_at:
+                return
+            self._payment_methods = {
+                method.id: method for method in PaymentMethod.objects.all()
+            }
+            self._categories = {
+                category.id: category for category in Category.objects.all()
+            }
+            self._version = version
+            self._expires_at = time.monotonic() + local_cache_ttl()
+            self._generation += 1
+
+    def invalidate(self):
+        """Invalida as tabelas deste processo e de todos os outros."""
+        with self._lock:
+            self._version = None
+            self._shared.bump()
+
+    @property
+    def version(self):
+        """Identifica o carregamento atual deste processo (após sincronizar)."""
+        self._sync()
+        return self._generation
+
+    # -----------------------
+    # CONSULTAS
+    # -----------------------
+
+    def _get(self, table: dict, model, pk):
+        # Registro criado depois do último carregamento (o signal só
+        # invalida no commit): busca uma vez e guarda
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+        if pk not in table:
+            obj = model.objects.filter(pk=pk).first()
+            if obj is None:
+                return None
+            with self._lock:
+                table[pk] = obj
+        return table[pk]
+
+    def get_payment_method(self, payment_method_id) -> PaymentMethod | None:
+        """Método de pagamento, ativo ou não (vendas antigas usam inativos)."""
+        self._sync()
+        return self._get(self._payment_methods, PaymentMethod, payment_method_id)
+
+    def get_active_payment_method(self, payment_method_id) -> PaymentMethod | None:
+        method = self.get_payment_method(payment_method_id)
+        return method if method is not None and method.is_active else None
+
+    def active_payment_methods(self) -> list[PaymentMethod]:
+        self._sync()
+        return sorted(
+            (method for method in self._payment_methods.values() if method.is_active),
+            key=lambda method: method.name,
+        )
+
+    def get_category(self, category_id) -> Category | None:
+        self._sync()
+        return self._get(self._categories, Category, category_id)
+
+    def get_categories(self) -> dict[int, Category]:
+        self._sync()
+        return dict(self._categories)
+
+
+reference_cache = ReferenceDataCache()
+
+
+# -----------------------
+# INVALIDAÇÃO (signals)
+# -----------------------
+
+@receiver(post_save, sender=PaymentMethod)
+@receiver(post_delete, sender=PaymentMethod)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def _reference_data_changed(sender, **kwargs):
+    transaction.on_commit(reference_cache.invalidate)
@@ -1,39 +1,70 @@
 from functools import wraps
 from django.http import JsonResponse
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from django.middleware.csrf import CsrfViewMiddleware
+from .auth_cache import token_user_cache
+
+
+class _CSRFCheck(CsrfViewMiddleware):
+    def _reject(self, request, reason):
+        return reason
+
+
+def _csrf_failure(request):
+    """
+    Motivo da falha de CSRF, ou None se a requisição passou.
+
+    As views com role_required são csrf_exempt porque esperam JWT; um
+    usuário autenticado por sessão (cookie) precisa passar pela mesma
+    checagem que o CsrfViewMiddleware faria, como no SessionAuthentication
+    do DRF. Métodos seguros (GET, HEAD...) sempre passam.
+    """
+    check = _CSRFCheck(lambda req: None)
+    check.process_request(request)
+    return check.process_view(request, None, (), {})
 
 
 def role_required(roles):
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(self, request, *args, **kwargs):
-            # Autenticar o usuário usando JWT
-            jwt_token = JWTAuthentication()
-            try:
-                user_auth_tuple = jwt_token.authenticate(request)
-                if user_auth_tuple is None:
+            user = getattr(request, 'user', None)
+
+            # Reaproveita o usuário se ele já foi autenticado pela sessão
+            # (exigindo CSRF); senão autentica o JWT com o cache de tokens
+            if user and user.is_authenticated:
+                if _csrf_failure(request):
                     return JsonResponse(
                         {
                             'status': 'error',
-                            'message': 'Autenticação obrigatória.'
+                            'message': 'Falha na verificação CSRF.'
+                        },
+                        status=403
+                    )
+            else:
+                try:
+                    user = token_user_cache.authenticate(request)
+                    if user is None:
+                        return JsonResponse(
+                            {
+                                'status': 'error',
+                                'message': 'Autenticação obrigatória.'
+                            },
+                            status=401
+                        )
+                    request.user = user
+                except Exception:
+                    return JsonResponse(
+                        {
+                            'status': 'error',
+                            'message': 'Token inválido.'
                         },
                         status=401
                     )
-                request.user, _ = user_auth_tuple
-            except Exception:
-                return JsonResponse(
-                    {
-                        'status': 'error',
-                        'message': 'Token inválido.'
-                    },
-                    status=401
-                )
 
-            user = getattr(request, 'user', None)
             user_role = getattr(user, "role", None)
 
-            # Check se o usuário está autenticado
-            if not user or not user.is_authenticated:
+            # Check se o usuário está autenticado e ativo
+            if not user.is_authenticated or not user.is_active:
                 return JsonResponse(
                     {
                         'status': 'error',
@@ -1,36 +1,90 @@
+from collections import defaultdict
+from ..models.sale import Sale
+from ..models.sale_item import SaleItem
 from ..types.sales_types import SaleDict, SaleItemDict, CustomerDict
 
+SALE_FIELDS = (
+    "id",
+    "date",
+    "total_amount",
+    "discount",
+    "status",
+    "customer_id",
+    "customer__name",
+    "customer__trade_name",
+    "customer__cnpj_or_cpf",
+    "customer__phone",
+    "customer__address",
+    "payment_method_id",
+    "payment_method__name",
+    "payment_method__type",
+)
 
-def sale_to_dict(sale) -> SaleDict:
-    customer = sale.customer
-
-    customer_dict: CustomerDict = {
-        "id": customer.id,
-        "name": customer.name,
-        "trade_name": customer.trade_name,
-        "cnpj_or_cpf": customer.cnpj_or_cpf,
-        "phone": customer.phone,
-        "address": customer.address,
-    }
-
-    items_list: list[SaleItemDict] = []
-
-    for item in sale.items.all():
-        items_list.append({
-            "id": item.id,
-            "product": item.product.name,
-            "quantity": item.quantity,
-            "unit_price": float(item.unit_price),
-            "subtotal": float(item.subtotal),
+ITEM_FIELDS = (
+    "id",
+    "sale_id",
+    "product__name",
+    "quantity",
+    "unit_price",
+    "subtotal",
+)
+
+
+def sales_to_dicts(queryset) -> list[SaleDict]:
+    """
+    Serializa qualquer quantidade de vendas com 2 consultas:
+    uma para vendas + cliente + pagamento (JOIN) e outra para os itens
+    + nome do produto. Mantém a ordem do queryset.
+    """
+    sales = list(queryset.values(*SALE_FIELDS))
+    if not sales:
+        return []
+
+    items_by_sale: dict[int, list[SaleItemDict]] = defaultdict(list)
+    items = (
+        SaleItem.objects
+        .filter(sale_id__in=[sale["id"] for sale in sales])
+        .order_by("id")
+        .values(*ITEM_FIELDS)
+    )
+    for item in items:
+        items_by_sale[item["sale_id"]].append({
+            "id": item["id"],
+            "product": item["product__name"],
+            "quantity": item["quantity"],
+            "unit_price": float(item["unit_price"]),
+            "subtotal": float(item["subtotal"]),
+        })
+
+    result: list[SaleDict] = []
+    for sale in sales:
+        customer_dict: CustomerDict = {
+            "id": sale["customer_id"],
+            "name": sale["customer__name"],
+            "trade_name": sale["customer__trade_name"],
+            "cnpj_or_cpf": sale["customer__cnpj_or_cpf"],
+            "phone": sale["customer__phone"],
+            "address": sale["customer__address"],
+        }
+
+        result.append({
+            "id": sale["id"],
+            "date": sale["date"].strftime("%Y-%m-%d %H:%M:%S"),
+            "customer": customer_dict,
+            "total_amount": float(sale["total_amount"]),
+            "discount": float(sale["discount"]),
+            "status": sale["status"],
+            "payment_method": {
+                "id": sale["payment_method_id"],
+                "name": sale["payment_method__name"],
+                "type": sale["payment_method__type"],
+            },
+            "items": items_by_sale[sale["id"]],
         })
 
-    return {
-        "id": sale.id,
-        "date": sale.date.strftime("%Y-%m-%d %H:%M:%S"),
-        "customer": customer_dict,
-        "total_amount": float(sale.total_amount),
-        "discount": float(sale.discount),
-        "status": sale.status,
-        "payment_method": sale.payment_method.name,
-        "items": items_list,
-    }
+    return result
+
+
+def sale_to_dict(sale) -> SaleDict:
+    """Serializa uma venda (2 consultas, independente do número de itens)."""
+    return sales_to_dicts(Sale.objects.filter(pk=sale.pk))[0]
@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta
+from django.utils import timezone
+from ..models.sale_item import SaleItem
+
+CHUNK_SIZE = 2000
+
+# (nome da coluna, campo em SaleItem)
+EXPORT_COLUMNS = [
+    ("sale_id", "sale_id"),
+    ("date", "sale__date"),
+    ("status", "sale__status"),
+    ("seller", "sale__seller__username"),
+    ("customer_id", "sale__customer_id"),
+    ("customer", "sale__customer__name"),
+    ("customer_document", "sale__customer__cnpj_or_cpf"),
+    ("payment_method", "sale__payment_method__name"),
+    ("sale_discount", "sale__discount"),
+    ("sale_total", "sale__total_amount"),
+    ("sale_paid", "sale__paid_amount"),
+    ("item_id", "id"),
+    ("product_id", "product_id"),
+    ("product", "product__name"),
+    ("quantity", "quantity"),
+    ("unit_price", "unit_price"),
+    ("subtotal", "subtotal"),
+]
+HEADER = [name for name, _ in EXPORT_COLUMNS]
+
+
+def date_range(start: date, end: date):
+    """Converte [start, end] (dias, inclusive) em datetimes no fuso local."""
+    return (
+        timezone.make_aware(datetime.combine(start, time.min)),
+        timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min)),
+    )
+
+
+def iter_sale_lines(start: date, end: date):
+    """
+    Uma linha por item vendido no período, já com venda, cliente,
+    vendedor, pagamento e produto (uma única consulta com JOINs),
+    lida em blocos por cursor no servidor: a memória fica constante.
+    """
+    start_at, end_at = date_range(start, end)
+    rows = (
+        SaleItem.objects
+        .filter(sale__date__gte=start_at, sale__date__lt=end_at)
+        .order_by("sale__date", "sale_id", "id")
+        .values_list(*[field for _, field in EXPORT_COLUMNS])
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    date_index = HEADER.index("date")
+    for row in rows:
+        row = list(row)
+        row[date_index] = timezone.localtime(row[date_index]).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        yield row
+
+
+def iter_csv(rows, chunk_rows: int = 1000):
+    """Gera o CSV em pedaços de chunk_rows linhas (inclui cabeçalho)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows, chunk_rows: int = 1000):
+    """Gera NDJSON (um objeto JSON por linha) em pedaços."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(HEADER, row)), default=str, ensure_ascii=False))
+        if len(lines) >= chunk_rows:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+FORMATS = {
+    "csv": (iter_csv, "text/csv"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
@@ -0,0 +1,63 @@
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+
+class SharedVersion:
+    """
+    Número de versão compartilhado entre processos, guardado no cache
+    do Django (CACHES["default"]). Os caches em memória (catálogo,
+    dados de referência, tokens) guardam a versão que carregaram e
+    descartam tudo quando ela muda.
+
+    Só funciona com vários workers se o backend for visto por todos
+    (banco, Redis, Memcached); com LocMemCache cada processo teria a
+    sua versão. A checagem api.W001 avisa nesse caso.
+
+    Para não consultar o backend a cada leitura, a versão lida fica
+    memorizada por CACHE_VERSION_CHECK_INTERVAL segundos: é o atraso
+    máximo para um processo perceber a invalidação feita por outro.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._lock = threading.Lock()
+        self._value = None
+        self._checked_at = 0.0
+
+    def get(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._value is not None
+                and now - self._checked_at < settings.CACHE_VERSION_CHECK_INTERVAL
+            ):
+                return self._value
+
+        version = cache.get(self.key)
+        if version is None:
+            cache.add(self.key, 1, timeout=None)
+            version = cache.get(self.key, 1)
+
+        with self._lock:
+            self._value = version
+            self._checked_at = now
+        return version
+
+    def bump(self):
+        """Muda a versão para todos os processos (inclusive este, na hora)."""
+        try:
+            cache.incr(self.key)
+        except ValueError:
+            cache.set(self.key, 1, timeout=None)
+        with self._lock:
+            self._value = None
+
+
+def local_cache_ttl() -> float:
+    """
+    Idade máxima (segundos) do conteúdo de um cache em memória, mesmo
+    sem invalidação: rede de segurança caso um aviso se perca.
+    """
+    return settings.LOCAL_CACHE_TTL
@@ -0,0 +1,54 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from ..utils.installments import installment_plans
+from ..utils.money import money
+from ..utils.role_required import role_required
+from django.http import JsonResponse
+
+
+class PaymentMethodView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @role_required(['admin', 'manager', 'checkout'])
+    def installments(self, request, payment_method_id):
+        """
+        Opções de parcelamento para a tela do caixa: ?amount=123.45
+        """
+        try:
+            amount = money(request.GET.get('amount', ''))
+        except ValueError:
+            amount = None
+        if amount is None or amount < 0:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid amount'
+                },
+                status=400
+            )
+
+        options = installment_plans.schedule(payment_method_id, amount)
+        if options is None:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Payment method not found'
+                },
+                status=404
+            )
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': [
+                    {
+                        'installments': option['installments'],
+                        'total': float(option['total']),
+                        'installment_amount': float(option['installment_amount']),
+                        'interest_free': option['interest_free'],
+                    }
+                    for option in options
+                ]
+            },
+            status=200
+        )
@@ -0,0 +1,44 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from ..models.print_job import PrintJob
+from ..utils.role_required import role_required
+from django.http import JsonResponse
+
+
+class PrintJobView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @role_required(['admin', 'manager', 'checkout'])
+    def get_job(self, request, job_id):
+        try:
+            job = PrintJob.objects.get(id=job_id)
+        except PrintJob.DoesNotExist:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Print job not found'
+                },
+                status=404
+            )
+
+        job_data = {
+            'id': job.id,
+            'sale_id': job.sale_id,
+            'printer_name': job.printer_name,
+            'status': job.status,
+            'attempts': job.attempts,
+            'max_attempts': job.max_attempts,
+            'next_attempt_at': job.next_attempt_at.strftime("%Y-%m-%d %H:%M:%S"),
+            'last_error': job.last_error,
+            'printed_at': (
+                job.printed_at.strftime("%Y-%m-%d %H:%M:%S")
+                if job.printed_at else None
+            ),
+        }
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': job_data
+            },
+            status=200
+        )
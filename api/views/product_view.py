@@ -0,0 +1,223 @@
+import json
+from datetime import datetime, time, timedelta
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from ..models.product import Product
+from ..models.stock_snapshot import StockSnapshot
+from ..utils.idempotency import idempotent
+from ..utils.role_required import role_required
+from ..utils.sales_forecast import reorder_list
+from django.db import transaction
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+
+
+class ProductView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @role_required(['admin', 'manager', 'checkout'])
+    def get_by_barcode(self, request, barcode):
+        product = Product.get_by_barcode(barcode)
+        if product is None:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Product not found'
+                },
+                status=404
+            )
+
+        category = product.category
+        product_data = {
+            'id': product.id,
+            'name': product.name,
+            'barcode': product.barcode,
+            'stock': product.stock,
+            'category': {
+                'id': category.id,
+                'name': category.name,
+                'price_tier_1': float(category.price_tier_1),
+            },
+        }
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': product_data
+            },
+            status=200
+        )
+
+    @role_required(['admin', 'manager'])
+    def reorder(self, request):
+        """
+        Lista de reposição: produtos que acabam em até ?days= dias
+        (padrão 14) no ritmo de venda atual.
+        """
+        try:
+            days = float(request.GET.get('days', 14))
+            limit = min(int(request.GET.get('limit', 200)), 1000)
+        except ValueError:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid parameters'
+                },
+                status=400
+            )
+
+        products_data = [
+            {
+                'id': row['product_id'],
+                'name': row['product__name'],
+                'stock': row['product__stock'],
+                'daily_velocity': round(row['daily_velocity'], 3),
+                'days_until_stockout': round(row['days_until_stockout'], 1),
+            }
+            for row in reorder_list(days, limit)
+        ]
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': products_data
+            },
+            status=200
+        )
+
+    @method_decorator(csrf_exempt)  # autenticação via JWT, não por sessão
+    @role_required(['admin', 'manager'])
+    @idempotent
+    def move_stock(self, request):
+        """
+        Ajuste manual ou recebimento de mercadoria, gravado no livro de
+        movimentações de estoque.
+
+        Corpo JSON esperado:
+        {
+            "kind": "receiving",
+            "items": [{"product_id": 1, "quantity": 10}],
+            "note": "NF 1234"
+        }
+
+        Em "receiving" as quantidades devem ser positivas; em
+        "adjustment" podem ser negativas (perda, quebra, inventário).
+        """
+        if request.method != 'POST':
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Method not allowed'
+                },
+                status=405
+            )
+
+        try:
+            data = json.loads(request.body or b'{}')
+            kind = data.get('kind')
+            deltas: dict[int, int] = {}
+            for item in data.get('items') or []:
+                product_id = int(item['product_id'])
+                deltas[product_id] = deltas.get(product_id, 0) + int(item['quantity'])
+        except (ValueError, TypeError, KeyError):
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid request body'
+                },
+                status=400
+            )
+
+        if kind not in ('adjustment', 'receiving') or not deltas:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid request body'
+                },
+                status=400
+            )
+        if kind == 'receiving' and any(delta <= 0 for delta in deltas.values()):
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Received quantities must be positive'
+                },
+                status=400
+            )
+        if Product.objects.filter(id__in=deltas).count() != len(deltas):
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Product not found'
+                },
+                status=404
+            )
+
+        with transaction.atomic():
+            applied = Product.apply_stock_deltas(
+                deltas, kind=kind, user=request.user, note=data.get('note'),
+            )
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': {
+                    'applied': [
+                        {'product_id': pk, 'quantity': quantity}
+                        for pk, quantity in applied.items()
+                    ]
+                }
+            },
+            status=201
+        )
+
+    @role_required(['admin', 'manager'])
+    def stock_at(self, request, product_id):
+        """
+        Estoque do produto num instante passado: ?at= aceita data e hora
+        ISO 8601 ou só a data (considera o fim do dia).
+        """
+        value = request.GET.get('at', '')
+        try:
+            when = parse_datetime(value)
+            if when is None:
+                day = parse_date(value)
+                if day is not None:
+                    when = datetime.combine(day + timedelta(days=1), time.min)
+                    when -= timedelta(microseconds=1)
+        except ValueError:  # formato certo, data impossível (2024-02-30)
+            when = None
+        if when is None:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid parameters'
+                },
+                status=400
+            )
+        if timezone.is_naive(when):
+            when = timezone.make_aware(when)
+
+        try:
+            stock = StockSnapshot.stock_at(product_id, when)
+        except Product.DoesNotExist:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Product not found'
+                },
+                status=404
+            )
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': {
+                    'product_id': product_id,
+                    'at': when.isoformat(),
+                    'stock': stock,
+                }
+            },
+            status=200
+        )
@@ -0,0 +1,104 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from ..models.daily_sales_summary import DailySalesSummary
+from ..utils.role_required import role_required
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncYear
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+
+class ReportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    PERIODS = {
+        'day': F('day'),
+        'month': TruncMonth('day'),
+        'year': TruncYear('day'),
+    }
+    SPLITS = {
+        'seller': 'seller_id',
+        'payment_method': 'payment_method_id',
+    }
+
+    @role_required(['admin', 'manager'])
+    def sales_summary(self, request):
+        """
+        Painel de vendas lido só do resumo diário (DailySalesSummary):
+        ?start=AAAA-MM-DD&end=AAAA-MM-DD (padrão: mês atual)
+        &period=day|month|year&status=completed
+        &split=seller|payment_method (opcional)
+        &seller_id=..&payment_method_id=.. (filtros opcionais)
+        """
+        today = timezone.localdate()
+        try:
+            start = parse_date(request.GET.get('start') or '') or today.replace(day=1)
+            end = parse_date(request.GET.get('end') or '') or today
+            filters = {
+                field: int(request.GET[field])
+                for field in ('seller_id', 'payment_method_id')
+                if request.GET.get(field)
+            }
+        except ValueError:  # data impossível (2024-02-30) ou id não numérico
+            return self._invalid_parameters()
+        period = request.GET.get('period', 'day')
+        split = request.GET.get('split')
+
+        if start > end or period not in self.PERIODS or (
+            split is not None and split not in self.SPLITS
+        ):
+            return self._invalid_parameters()
+
+        summaries = DailySalesSummary.objects.filter(
+            day__gte=start,
+            day__lte=end,
+            status=request.GET.get('status', 'completed'),
+            **filters,
+        )
+
+        group_by = ['period'] + ([self.SPLITS[split]] if split else [])
+        rows = (
+            summaries
+            .annotate(period=self.PERIODS[period])
+            .values(*group_by)
+            .annotate(
+                sales_count=Sum('sales_count'),
+                revenue=Sum('revenue'),
+                discount=Sum('discount'),
+                profit=Sum('profit'),
+                units=Sum('units'),
+            )
+            .order_by(*group_by)
+        )
+
+        data = [
+            {
+                **{key: row[key] for key in group_by if key != 'period'},
+                'period': row['period'].isoformat(),
+                'sales_count': row['sales_count'],
+                'revenue': float(row['revenue']),
+                'discount': float(row['discount']),
+                'profit': float(row['profit']),
+                'units': row['units'],
+            }
+            for row in rows
+        ]
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': data
+            },
+            status=200
+        )
+
+    @staticmethod
+    def _invalid_parameters():
+        return JsonResponse(
+            {
+                'status': 'error',
+                'message': 'Invalid parameters'
+            },
+            status=400
+        )
@@ -0,0 +1,293 @@
+import json
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from ..models.sale import Sale, SaleAlreadyFinalized
+from ..utils.catalog_cache import catalog_cache
+from ..utils.idempotency import idempotent
+from ..utils.pricing_engine import pricing_engine
+from ..utils.print_queue import enqueue_sale_receipt, normalize_change
+from ..utils.printer_loader import PrinterConfigError
+from ..utils.role_required import role_required
+from ..utils.sale_converter import sale_to_dict
+from ..utils.sales_export import FORMATS, iter_sale_lines
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_date
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+
+
+class SaleView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @method_decorator(csrf_exempt)  # autenticação via JWT, não por sessão
+    @role_required(['admin', 'manager', 'checkout'])
+    @idempotent
+    def checkout(self, request):
+        """
+        Cria a venda inteira (itens, preços e baixa de estoque) numa
+        única requisição e numa única transação.
+
+        Corpo JSON esperado:
+        {
+            "items": [
+                {"product_id": 1, "quantity": 2},
+                {"barcode": "7891234567890", "quantity": 1}
+            ],
+            "payment_method_id": 1,
+            "installments": 1,
+            "discount": 0,
+            "customer_id": 1,
+            "notes": "",
+            "print_receipt": true,
+            "change": {"money_received": 50.0, "change": 3.5}
+        }
+
+        Com print_receipt o comprovante é enfileirado para o worker de
+        impressão, na mesma transação da venda; a resposta não espera a
+        impressora. Se o printer.json estiver inválido a venda é gravada
+        assim mesmo e a resposta traz print_error.
+
+        Aceita o header Idempotency-Key para retentativas seguras.
+        """
+        if request.method != 'POST':
+            return self._method_not_allowed()
+
+        print_job_id = None
+        print_error = None
+        try:
+            data = json.loads(request.body or b'{}')
+            change = normalize_change(data.get('change'))
+
+            # A venda e o job de impressão são gravados juntos
+            with transaction.atomic():
+                sale = Sale.checkout(
+                    cart=data.get('items') or [],
+                    payment_method_id=data.get('payment_method_id'),
+                    seller=request.user,
+                    customer_id=data.get('customer_id'),
+                    discount=data.get('discount', 0),
+                    installments=int(data.get('installments', 1)),
+                    notes=data.get('notes'),
+                )
+                if data.get('print_receipt'):
+                    try:
+                        print_job_id = enqueue_sale_receipt(
+                            sale, request.user.id, change
+                        ).id
+                    except PrinterConfigError as e:
+                        # A venda vale mesmo sem impressora configurada
+                        print_error = str(e)
+        except ValidationError as e:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': ' '.join(e.messages)
+                },
+                status=400
+            )
+        except (ValueError, TypeError, AttributeError):
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid request body'
+                },
+                status=400
+            )
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': sale_to_dict(sale),
+                'print_job_id': print_job_id,
+                'print_error': print_error,
+            },
+            status=201
+        )
+
+    @method_decorator(csrf_exempt)  # autenticação via JWT, não por sessão
+    @role_required(['admin', 'manager', 'checkout'])
+    def quote(self, request):
+        """
+        Orçamento do carrinho sem gravar nada, com a prévia opcional
+        "e se levar mais N unidades":
+
+        {
+            "items": [{"product_id": 1, "quantity": 2}],
+            "preview": {"product_id": 1, "max_extra": 10}
+        }
+        """
+        if request.method != 'POST':
+            return self._method_not_allowed()
+
+        try:
+            data = json.loads(request.body or b'{}')
+            lines = Sale.resolve_cart(data.get('items') or [])
+            cart = [(product.category_id, quantity) for product, quantity in lines]
+            quote = pricing_engine.price_cart(cart)
+            preview = data.get('preview')
+            if preview:
+                preview_product = catalog_cache.get_product(int(preview['product_id']))
+                max_extra = min(int(preview.get('max_extra', 10)), 1000)
+                if preview_product is None:
+                    raise ValidationError('Produto não encontrado.')
+                preview_totals = pricing_engine.preview_additions(
+                    cart, preview_product.category_id, max_extra,
+                )
+        except ValidationError as e:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': ' '.join(e.messages)
+                },
+                status=400
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid request body'
+                },
+                status=400
+            )
+
+        quote_data = {
+            'total_quantity': quote.total_quantity,
+            'total': float(quote.total),
+            'items': [
+                {
+                    'product_id': product.id,
+                    'name': product.name,
+                    'quantity': quantity,
+                    'unit_price': float(unit_price),
+                    'subtotal': float(subtotal),
+                }
+                for (product, quantity), unit_price, subtotal
+                in zip(lines, quote.unit_prices, quote.subtotals)
+            ],
+        }
+        if preview:
+            quote_data['preview'] = [
+                {'extra': extra, 'total': float(total)}
+                for extra, total in enumerate(preview_totals, start=1)
+            ]
+
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': quote_data
+            },
+            status=200
+        )
+
+    @method_decorator(csrf_exempt)
+    @role_required(['admin', 'manager', 'checkout'])
+    @idempotent
+    def finalize_sale(self, request, sale_id):
+        if request.method != 'POST':
+            return self._method_not_allowed()
+
+        try:
+            sale = Sale.objects.get(id=sale_id)
+        except Sale.DoesNotExist:
+            return self._sale_not_found()
+
+        try:
+            sale.finalize_sale()
+        except SaleAlreadyFinalized:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Sale already finalized'
+                },
+                status=409
+            )
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': sale_to_dict(sale)
+            },
+            status=200
+        )
+
+    @method_decorator(csrf_exempt)
+    @role_required(['admin', 'manager'])
+    @idempotent
+    def cancel_sale(self, request, sale_id):
+        if request.method != 'POST':
+            return self._method_not_allowed()
+
+        try:
+            sale = Sale.objects.get(id=sale_id)
+        except Sale.DoesNotExist:
+            return self._sale_not_found()
+
+        sale.cancel_sale(user=request.user)
+        return JsonResponse(
+            {
+                'status': 'success',
+                'data': sale_to_dict(sale)
+            },
+            status=200
+        )
+
+    @role_required(['admin', 'manager'])
+    def export_sales(self, request):
+        """
+        Exporta os itens vendidos no período, em streaming:
+        ?start=AAAA-MM-DD&end=AAAA-MM-DD&format=csv|ndjson
+        """
+        try:
+            start = parse_date(request.GET.get('start') or '')
+            end = parse_date(request.GET.get('end') or '')
+        except ValueError:  # formato certo, data impossível (2024-02-30)
+            start = end = None
+        export_format = request.GET.get('format', 'csv')
+
+        if start is None or end is None or start > end:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid period'
+                },
+                status=400
+            )
+        if export_format not in FORMATS:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid format'
+                },
+                status=400
+            )
+
+        render, content_type = FORMATS[export_format]
+        response = StreamingHttpResponse(
+            render(iter_sale_lines(start, end)),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="vendas_{start}_{end}.{export_format}"'
+        )
+        return response
+
+    @staticmethod
+    def _method_not_allowed():
+        return JsonResponse(
+            {
+                'status': 'error',
+                'message': 'Method not allowed'
+            },
+            status=405
+        )
+
+    @staticmethod
+    def _sale_not_found():
+        return JsonResponse(
+            {
+                'status': 'error',
+                'message': 'Sale not found'
+            },
+            status=404
+        )
@@ -1,6 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from ..models.user import User
+from ..utils.pagination import InvalidCursor, KeysetPaginator
 from ..utils.role_required import role_required
 from django.http import JsonResponse
 from django.db import IntegrityError
@@ -9,22 +10,47 @@ from django.db import IntegrityError
 class UserView(APIView):
     permission_classes = [IsAuthenticated]
 
+    # ?order=... → ordenação do cursor
+    LIST_ORDERINGS = {
+        'id': KeysetPaginator(('id',)),
+        'username': KeysetPaginator(('username', 'id')),
+    }
+
     @role_required(['admin', 'manager', 'checkout'])
     def list_users(self, request):
-        users = User.objects.all()
-        users_data = [
-            {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'role': user.role,
-            }
-            for user in users
-        ]
+        """
+        Lista paginada por cursor: ?limit=50&order=id|username&cursor=...
+        A resposta traz next_cursor (null na última página).
+        """
+        paginator = self.LIST_ORDERINGS.get(request.GET.get('order', 'id'))
+        if paginator is None:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid order'
+                },
+                status=400
+            )
+
+        users = User.objects.values('id', 'username', 'email', 'role')
+        try:
+            page = paginator.paginate(
+                users, request.GET.get('cursor'), request.GET.get('limit')
+            )
+        except InvalidCursor:
+            return JsonResponse(
+                {
+                    'status': 'error',
+                    'message': 'Invalid cursor'
+                },
+                status=400
+            )
+
         return JsonResponse(
             {
                 'status': 'success',
-                'data': users_data
+                'data': page.items,
+                'next_cursor': page.next_cursor,
             },
             status=200
         )
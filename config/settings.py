@@ -138,6 +138,34 @@ DATABASES = {
 }
 
 
+# Cache
+# Guarda as versões dos caches em memória (catálogo, métodos de
+# pagamento, tokens). Precisa ser compartilhado por todos os workers
+# para que uma mudança de preço feita num processo invalide os outros:
+# o padrão é o banco (rode "python manage.py createcachetable");
+# Redis/Memcached também servem. LocMemCache só para um único processo.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.db.DatabaseCache',
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'stockplus_cache'),
+    }
+}
+
+# Segundos que um processo pode levar para perceber a invalidação feita
+# por outro (a versão compartilhada é relida no máximo nesse intervalo).
+CACHE_VERSION_CHECK_INTERVAL = float(os.getenv('CACHE_VERSION_CHECK_INTERVAL', 1))
+
+# Idade máxima (segundos) dos caches em memória mesmo sem invalidação.
+LOCAL_CACHE_TTL = float(os.getenv('LOCAL_CACHE_TTL', 300))
+
+
+# Tempo (segundos) que as respostas de requisições com Idempotency-Key
+# ficam guardadas para responder retentativas.
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', 60 * 60 * 24))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 